@@ -1,3 +1,4 @@
+import functools
 import os
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -12,6 +13,7 @@ class CustomEnum(Enum):
         return {c.name.lower(): c for c in cls}
 
     @classmethod
+    @functools.lru_cache(maxsize=128)  # the same values are mapped for every profile read
     def from_str(cls, string: str) -> Optional["CustomEnum"]:
         if string:
             final_str = string.strip().lower()
@@ -175,7 +177,7 @@ class ProfileFile(RootFileModel, ABC):
 
     def set_path(self, path: str):
         self.path = path.strip() if path is not None else None
-        self.name = '.'.join(os.path.basename(self.path).split('.')[0:-1]) if self.path else None
+        self.name = os.path.basename(self.path).rpartition('.')[0] if self.path else None
 
 
 class ScriptSettings(FileModel):
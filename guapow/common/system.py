@@ -1,9 +1,10 @@
 import asyncio
 import os
 import re
+import shlex
 import subprocess
+import sys
 import traceback
-from datetime import datetime, timedelta
 from io import StringIO
 from re import Pattern
 from typing import Optional, Tuple, Dict, List, Set, Callable, TypeVar, Collection, Generator
@@ -11,6 +12,7 @@ from typing import Optional, Tuple, Dict, List, Set, Callable, TypeVar, Collecti
 BAD_USER_ENV_VARS = {'LD_PRELOAD'}
 T = TypeVar('T')
 RE_SEVERAL_SPACES = re.compile(r'\s+')
+PS_PROCESSES_BY_PARENT_CMD = 'ps -Ao ppid,pid,comm -ww --no-headers'
 
 
 class ProcessTimedOutError(Exception):
@@ -80,7 +82,7 @@ async def async_syscall(cmd: str, shell: bool = True, cwd: Optional[str] = None,
         if shell:
             p = await asyncio.create_subprocess_shell(**params)
         else:
-            p = await asyncio.create_subprocess_exec(**params)
+            p = await asyncio.create_subprocess_exec(*shlex.split(params.pop('cmd')), **params)
     except:
         traceback.print_exc()
         return False, None
@@ -332,15 +334,12 @@ async def run_async_process(cmd: str, user_id: Optional[int] = None, custom_env:
             if timeout is None or timeout < 0:
                 return p.pid, await p.wait(), ((await p.stdout.read()).decode() if output else None)
             elif timeout and timeout > 0:
-                timeout_at = datetime.now() + timedelta(seconds=timeout)
+                try:
+                    returncode = await asyncio.wait_for(p.wait(), timeout)
+                except asyncio.TimeoutError:
+                    raise ProcessTimedOutError(p.pid)
 
-                while datetime.now() < timeout_at:
-                    if p.returncode is not None:
-                        return p.pid, p.returncode, ((await p.stdout.read()).decode() if output else None)
-
-                    await asyncio.sleep(0.0005)
-
-                raise ProcessTimedOutError(p.pid)
+                return p.pid, returncode, ((await p.stdout.read()).decode() if output else None)
 
         return p.pid, p.returncode, None
     except ProcessTimedOutError:
@@ -349,32 +348,93 @@ async def run_async_process(cmd: str, user_id: Optional[int] = None, custom_env:
         return p.pid, 1, (traceback.format_exc().replace('\n', ' ') if exception_output else None)
 
 
+def read_processes_by_parent(proc_dir: str = '/proc') -> Optional[Dict[int, Set[Tuple[int, str]]]]:
+    """
+    Maps the running processes by their parents reading the 'stat' file of each process (no subprocess involved).
+    Defunct processes have ' <defunct>' appended to their names (as 'ps' does).
+    Returns: None if 'proc_dir' cannot be read
+    """
+    try:
+        entries = os.scandir(proc_dir)
+    except OSError:
+        return
+
+    proc_tree = dict()
+
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+
+            try:
+                with open(f'{entry.path}/stat', 'rb') as f:
+                    stat = f.read(512).decode(errors='replace')  # names are not guaranteed to be valid UTF-8
+            except OSError:
+                continue  # the process is gone
+
+            # the name is between the first '(' and the last ')' since it may contain spaces and parenthesis
+            comm_start, comm_end = stat.find('('), stat.rfind(')')
+
+            if comm_start < 0 or comm_end < comm_start:
+                continue
+
+            state_ppid = stat[comm_end + 2:].split(' ', 2)
+
+            if len(state_ppid) < 2:
+                continue
+
+            try:
+                ppid = int(state_ppid[1])
+            except ValueError:
+                continue
+
+            comm = stat[comm_start + 1:comm_end]
+
+            if state_ppid[0] == 'Z':
+                comm = f'{comm} <defunct>'
+
+            comm = sys.intern(comm)  # the same names are shared across scans
+
+            children = proc_tree.get(ppid)
+
+            if not children:
+                children = set()
+                proc_tree[ppid] = children
+
+            children.add((int(entry.name), comm))
+
+    return proc_tree
+
+
 async def map_processes_by_parent() -> Dict[int, Set[Tuple[int, str]]]:
-    exitcode, output = await async_syscall(f'ps -Ao ppid,pid,comm -ww --no-headers')
+    proc_tree = read_processes_by_parent()
+
+    if proc_tree is not None:
+        return proc_tree
+
+    exitcode, output = await async_syscall(PS_PROCESSES_BY_PARENT_CMD, shell=False)  # no shell needed
 
     if exitcode == 0 and output:
         proc_tree = dict()
 
-        for line in output.split("\n"):
-            line_strip = line.strip()
+        for line in output.splitlines():
+            line_split = line.split(None, 2)
 
-            if line_strip:
-                line_split = RE_SEVERAL_SPACES.split(line_strip, 2)
+            if len(line_split) < 3:
+                continue
 
-                if len(line_split) > 2:
-                    ppid, pid, comm, = (e.strip() for e in line_split)
-                    try:
-                        ppid, pid = int(ppid), int(pid)
-                    except ValueError:
-                        continue
+            try:
+                ppid, pid = int(line_split[0]), int(line_split[1])
+            except ValueError:
+                continue
 
-                    children = proc_tree.get(ppid)
+            children = proc_tree.get(ppid)
 
-                    if not children:
-                        children = set()
-                        proc_tree[ppid] = children
+            if not children:
+                children = set()
+                proc_tree[ppid] = children
 
-                    children.add((pid, comm))
+            children.add((pid, sys.intern(line_split[2].rstrip())))
 
         return proc_tree
 
@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 from re import Pattern
@@ -6,6 +7,7 @@ from typing import Optional, Dict
 re_any_operator = re.compile(r'\*+')
 
 
+@functools.lru_cache(maxsize=256)  # the same names are mapped again for every request
 def map_any_regex(word: str) -> Optional[Pattern]:
     if word:
         if has_any_regex(word):
@@ -1,9 +1,12 @@
 import asyncio
+import functools
 import re
+import sys
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from logging import Logger
-from typing import Dict, Optional, Tuple, Generator, AsyncGenerator, Pattern, Set, List
+from typing import Dict, Optional, Tuple, Generator, AsyncGenerator, Pattern, Set, List, FrozenSet
 
 import aiofiles
 
@@ -11,7 +14,7 @@ from guapow import __app_name__
 from guapow.common import util
 from guapow.common.dto import OptimizationRequest
 from guapow.common.model import CustomEnum
-from guapow.common.system import async_syscall, map_processes_by_parent, find_process_children, RE_SEVERAL_SPACES
+from guapow.common.system import async_syscall, map_processes_by_parent, find_process_children
 from guapow.common.users import is_root_user
 from guapow.service.optimizer.profile import OptimizationProfile
 
@@ -27,11 +30,16 @@ class LauncherSearchMode(CustomEnum):
         return LauncherSearchMode.COMMAND if string.startswith('/') else LauncherSearchMode.NAME
 
 
-def gen_possible_launchers_file_paths(user_id: int, user_name: str) -> Generator[str, None, None]:
+@functools.lru_cache(maxsize=256)
+def _map_possible_launchers_file_paths(user_id: int, user_name: str) -> Tuple[str, ...]:
     if not is_root_user(user_id):
-        yield f'/home/{user_name}/.config/{__app_name__}/launchers'
+        return f'/home/{user_name}/.config/{__app_name__}/launchers', f'/etc/{__app_name__}/launchers'
+
+    return (f'/etc/{__app_name__}/launchers',)
 
-    yield f'/etc/{__app_name__}/launchers'
+
+def gen_possible_launchers_file_paths(user_id: int, user_name: str) -> Generator[str, None, None]:
+    yield from _map_possible_launchers_file_paths(user_id, user_name)  # the paths are only built once per user
 
 
 def map_target(string: str, mapping: str, logger: Logger) -> Optional[Tuple[str, LauncherSearchMode]]:
@@ -91,6 +99,24 @@ async def map_launchers_file(wrapper_file: str, logger: Logger) -> Optional[Dict
     return wrappers
 
 
+class ProcessesByParentSnapshot:
+    """
+    Shares the same processes table (mapped by parent) between the reads performed within 'max_age' seconds
+    """
+
+    def __init__(self, max_age: float):
+        self._max_age = max_age
+        self._processes: Optional[Dict[int, Set[Tuple[int, str]]]] = None
+        self._expires_at: Optional[float] = None
+
+    async def read(self) -> Optional[Dict[int, Set[Tuple[int, str]]]]:
+        if self._processes is None or self._max_age <= 0 or time.monotonic() >= self._expires_at:
+            self._processes = await map_processes_by_parent()
+            self._expires_at = time.monotonic() + self._max_age
+
+        return self._processes
+
+
 class LauncherMapper(ABC):
     """
     Responsible for mapping the real processes to be optimized since a source process.
@@ -120,11 +146,25 @@ class ExplicitLauncherMapper(LauncherMapper):
     """
 
     def __init__(self, check_time: float, found_check_time: float, logger: Logger,
-                 iteration_sleep_time: float = 0.1):
+                 iteration_sleep_time: float = 0.1, missing_file_ttl: float = 10):
         super(ExplicitLauncherMapper, self).__init__(check_time=check_time,
                                                      found_check_time=found_check_time,
                                                      logger=logger)
         self._iteration_sleep_time = iteration_sleep_time
+        self._missing_file_ttl = missing_file_ttl  # seconds a not found launchers file is not checked again
+        self._missing_files: Dict[str, float] = dict()  # launchers file path -> when it should be checked again
+
+    def _is_known_missing_file(self, file_path: str) -> bool:
+        check_again_at = self._missing_files.get(file_path)
+
+        if check_again_at is None:
+            return False
+
+        if time.monotonic() >= check_again_at:
+            del self._missing_files[file_path]
+            return False
+
+        return True
 
     @staticmethod
     async def map_process_by_pid(mode: LauncherSearchMode, ignore: Set[int]) -> Optional[Dict[int, str]]:
@@ -135,22 +175,21 @@ class ExplicitLauncherMapper(LauncherMapper):
             if exitcode == 0 and output:
                 pid_comm = dict()
 
-                for line in output.split("\n"):
-                    line_strip = line.strip()
+                for line in output.splitlines():
+                    line_split = line.split(None, 1)
 
-                    if line_strip:
-                        line_split = RE_SEVERAL_SPACES.split(line_strip, 1)
+                    if len(line_split) < 2:
+                        continue
 
-                        if len(line_split) > 1:
-                            try:
-                                pid = int(line_split[0])
-                            except ValueError:
-                                continue
+                    try:
+                        pid = int(line_split[0])
+                    except ValueError:
+                        continue
 
-                            if pid in ignore:
-                                continue
+                    if pid in ignore:
+                        continue
 
-                            pid_comm[pid] = line_split[1].strip()
+                    pid_comm[pid] = line_split[1].rstrip()
 
                 return pid_comm
 
@@ -203,6 +242,9 @@ class ExplicitLauncherMapper(LauncherMapper):
             launchers = None
 
             for file_path in gen_possible_launchers_file_paths(request.user_id, request.user_name):
+                if self._is_known_missing_file(file_path):
+                    continue
+
                 try:
                     self._log.debug(f"Checking mapped launchers on '{file_path}' (request: {request.pid})")
                     launchers = await map_launchers_file(file_path, self._log)
@@ -210,6 +252,9 @@ class ExplicitLauncherMapper(LauncherMapper):
                 except FileNotFoundError:
                     self._log.debug(f"Launchers file '{file_path}' not found (request: {request.pid})")
 
+                    if self._missing_file_ttl > 0:
+                        self._missing_files[file_path] = time.monotonic() + self._missing_file_ttl
+
         if launchers:
             file_name = request.command.split('/')[-1].strip()
 
@@ -230,18 +275,40 @@ class ExplicitLauncherMapper(LauncherMapper):
             self._log.debug("No valid launchers mapped found")
 
 
+# Steam child processes that should not be optimized (interned since they are compared against every process name)
+STEAM_IGNORED_PROCESSES = frozenset(sys.intern(name) for name in (
+    "wineserver", "services.exe", "winedevice.exe", "plugplay.exe", "svchost.exe",
+    "explorer.exe", "rpcss.exe", "tabtip.exe", "wine", "wine64", "wineboot.exe",
+    "cmd.exe", "conhost.exe", "start.exe", "winemenubuilder", "steam-runtime-l", "proton",
+    "gzip", "steam.exe", "python", "python3", "OriginWebHelper", "Origin.exe",
+    "OriginClientSer", "QtWebEngineProc", "EASteamProxy.ex", "ActivationUI.ex",
+    "EALink.exe", "OriginLegacyCLI", "IGOProxy.exe", "IGOProxy32.exe", "IGOProxy64.exe",
+    "igoproxy64.exe", "ldconfig", "UPlayBrowser.exe", "UbisoftGameLaun", "upc.exe",
+    "UplayService.ex", "UplayWebCore.ex", "CrRendererMain", "regsvr32", "CrGpuMain",
+    "CrUtilityMain", "whql:off", "PnkBstrA.exe", "EABackgroundSer", "EADesktop.exe",
+    "EALocalHostSvc.", "EADestager.exe", "EALaunchHelper", "Link2EA.exe",
+    "ThreadPoolSingl ", "CrBrowserMain", "rundll32.exe", "iexplore.exe", "UnityCrashHandl"))
+
+
 class SteamLauncherMapper(LauncherMapper):
 
     def __init__(self, check_time: float, found_check_time: float, logger: Logger,
-                 iteration_sleep_time: float = 0.1):
+                 iteration_sleep_time: float = 0.1, max_iteration_sleep_time: float = 1):
         super(SteamLauncherMapper, self).__init__(check_time=check_time,
                                                   found_check_time=found_check_time,
                                                   logger=logger)
         self._re_steam_cmd: Optional[Pattern] = None
-        self._to_ignore: Optional[Set[str]] = None  # processes that should not be optimized
         self._re_proton_command: Optional[Pattern] = None
         self._iteration_sleep_time = iteration_sleep_time  # used to avoid CPU overloading while looking for targets
 
+        # the sleep time grows up to this value while the processes do not change between iterations
+        self._max_iteration_sleep_time = max(iteration_sleep_time, max_iteration_sleep_time)
+        self._root_names: Dict[str, Optional[str]] = dict()  # Steam root process name by command
+        self._max_cached_root_names = 256
+
+        # concurrent mappings share the same processes table within an iteration
+        self._processes_snapshot = ProcessesByParentSnapshot(max_age=iteration_sleep_time / 2)
+
     @property
     def re_steam_cmd(self) -> Pattern:
         if not self._re_steam_cmd:
@@ -257,21 +324,8 @@ class SteamLauncherMapper(LauncherMapper):
         return self._re_proton_command
 
     @property
-    def to_ignore(self) -> Set[str]:
-        if self._to_ignore is None:
-            self._to_ignore = {"wineserver", "services.exe", "winedevice.exe", "plugplay.exe", "svchost.exe",
-                               "explorer.exe", "rpcss.exe", "tabtip.exe", "wine", "wine64", "wineboot.exe",
-                               "cmd.exe", "conhost.exe", "start.exe", "winemenubuilder", "steam-runtime-l", "proton",
-                               "gzip", "steam.exe", "python", "python3", "OriginWebHelper", "Origin.exe",
-                               "OriginClientSer", "QtWebEngineProc", "EASteamProxy.ex", "ActivationUI.ex",
-                               "EALink.exe", "OriginLegacyCLI", "IGOProxy.exe", "IGOProxy32.exe", "IGOProxy64.exe",
-                               "igoproxy64.exe", "ldconfig", "UPlayBrowser.exe", "UbisoftGameLaun", "upc.exe",
-                               "UplayService.ex", "UplayWebCore.ex", "CrRendererMain", "regsvr32", "CrGpuMain",
-                               "CrUtilityMain", "whql:off", "PnkBstrA.exe", "EABackgroundSer", "EADesktop.exe",
-                               "EALocalHostSvc.", "EADestager.exe", "EALaunchHelper", "Link2EA.exe",
-                               "ThreadPoolSingl ", "CrBrowserMain", "rundll32.exe", "iexplore.exe", "UnityCrashHandl"}
-
-        return self._to_ignore
+    def to_ignore(self) -> FrozenSet[str]:
+        return STEAM_IGNORED_PROCESSES
 
     def find_target_in_hierarchy(self, reverse_hierarchy: List[str], root_element_pid: int,
                                  processes_by_parent: Optional[Dict[int, Set[Tuple[int, str]]]] = None,
@@ -285,35 +339,30 @@ class SteamLauncherMapper(LauncherMapper):
         if reverse_hierarchy[-1] not in comm_pid:
             comm_pid[reverse_hierarchy[-1]] = root_element_pid
 
-        for idx, comm in enumerate(reverse_hierarchy):
-            pid = comm_pid.get(comm)
+        # resuming from the deepest level mapped by previous calls
+        resolved_idx = len(reverse_hierarchy) - 1
+        while resolved_idx > 0 and reverse_hierarchy[resolved_idx - 1] in comm_pid:
+            resolved_idx -= 1
 
-            if pid is None:
-                parent_id = comm_pid.get(reverse_hierarchy[idx + 1])
-
-                if not parent_id:
-                    continue  # the iteration must continue if the parent id is not mapped yet
+        parent_id = comm_pid[reverse_hierarchy[resolved_idx]]
+        for idx in range(resolved_idx - 1, -1, -1):
+            parent_children = processes_by_parent.get(parent_id) if processes_by_parent else None
 
-                parent_children = processes_by_parent.get(parent_id)
+            if not parent_children:
+                return   # if the parent has no children, it will not be possible to find the current comm's pid
 
-                if not parent_children:
-                    return   # if the parent has no children, it will not be possible to find the current comm's pid
+            comm = reverse_hierarchy[idx]
 
-                try:
-                    pid = next(pid_ for pid_, comm_ in sorted(parent_children, reverse=True) if comm_ == comm)
-                except StopIteration:
-                    return  # the current comm could not be found, so stop the iteration
+            # the latest child (highest pid) matching the current comm is picked in a single pass
+            pid = max((pid_ for pid_, comm_ in parent_children if comm_ == comm), default=None)
 
-                comm_pid[comm] = pid
+            if pid is None:
+                return  # the current comm could not be found, so stop the iteration (resumed on the next call)
 
-            if idx == 0:  # if current element is the target, return it immediately
-                return pid
+            comm_pid[comm] = pid
+            parent_id = pid
 
-            # restart the find
-            return self.find_target_in_hierarchy(reverse_hierarchy=reverse_hierarchy,
-                                                 root_element_pid=root_element_pid,
-                                                 processes_by_parent=processes_by_parent,
-                                                 pid_by_comm=comm_pid)
+        return parent_id
 
     def map_expected_hierarchy(self, request: OptimizationRequest, root_comm: Optional[str] = None) -> List[str]:
         hierarchy = list()
@@ -330,11 +379,18 @@ class SteamLauncherMapper(LauncherMapper):
 
         return hierarchy
 
-    def extract_root_process_name(self, command: str) -> str:
+    def extract_root_process_name(self, command: str) -> Optional[str]:
+        if command in self._root_names:
+            return self._root_names[command]
+
         root_cmd = self.re_steam_cmd.findall(command)
+        root_name = root_cmd[0] if root_cmd else None
+
+        if len(self._root_names) >= self._max_cached_root_names:
+            del self._root_names[next(iter(self._root_names))]  # discarding the oldest command
 
-        if root_cmd:
-            return root_cmd[0]
+        self._root_names[command] = root_name
+        return root_name
 
     async def map_pids(self, request: OptimizationRequest, profile: OptimizationProfile) -> AsyncGenerator[int, None]:
         if profile.steam:
@@ -345,21 +401,25 @@ class SteamLauncherMapper(LauncherMapper):
             else:
                 self._log.debug(f'Steam command detected for request (pid: {request.pid})')
                 expected_hierarchy = self.map_expected_hierarchy(request, steam_root_comm)
-                timeout = datetime.now() + timedelta(seconds=self._check_time)
+                timeout = time.monotonic() + self._check_time
 
                 latest_found_timeout = None  # timeout for every time a target is found (to stop faster)
                 pid_by_comm = dict()  # to save which processes were previously mapped
                 already_found: Set[int] = set()  # processes already yielded
                 target_ppid = None  # parent with the target children
 
-                to_ignore = {*expected_hierarchy, *self.to_ignore}  # target children to ignore
+                to_ignore = self.to_ignore.union(expected_hierarchy)  # target children to ignore
 
-                while datetime.now() < timeout:
-                    if latest_found_timeout and datetime.now() >= latest_found_timeout:
+                sleep_time = self._iteration_sleep_time
+                previous_children = None  # the searched subtree on the previous iteration
+
+                now = time.monotonic()  # read once per iteration
+                while now < timeout:
+                    if latest_found_timeout and now >= latest_found_timeout:
                         self._log.debug(f"Steam subprocesses search timed out earlier (source_pid={request.pid})")
                         return
 
-                    parent_procs = await map_processes_by_parent()
+                    parent_procs = await self._processes_snapshot.read()
 
                     if target_ppid is None:
                         target_ppid = self.find_target_in_hierarchy(reverse_hierarchy=expected_hierarchy,
@@ -377,13 +437,32 @@ class SteamLauncherMapper(LauncherMapper):
                                                                         comm_to_ignore=to_ignore,
                                                                         recursive=False):
                             if self._found_check_time >= 0:
-                                latest_found_timeout = datetime.now() + timedelta(seconds=self._found_check_time)
+                                latest_found_timeout = time.monotonic() + self._found_check_time
 
                             self._log.info(f"Steam child process found: {comm_} (pid={pid_}, ppid={ppid_})")
                             yield pid_
 
                     if self._iteration_sleep_time > 0:
-                        await asyncio.sleep(self._iteration_sleep_time)
+                        # only the searched subtree is compared, since unrelated processes change all the time
+                        searched_ppid = target_ppid if target_ppid is not None else \
+                            next((pid_by_comm[c] for c in expected_hierarchy if c in pid_by_comm), request.pid)
+                        children = searched_ppid, parent_procs.get(searched_ppid) if parent_procs else None
+
+                        if children == previous_children:  # backing off while nothing changes
+                            sleep_time = min(sleep_time * 1.5, self._max_iteration_sleep_time)
+                        else:
+                            sleep_time = self._iteration_sleep_time
+
+                        previous_children = children
+
+                        # never sleeping beyond the search timeouts
+                        deadline = min(timeout, latest_found_timeout) if latest_found_timeout else timeout
+                        remaining_time = deadline - time.monotonic()
+
+                        if remaining_time > 0:
+                            await asyncio.sleep(min(sleep_time, remaining_time))
+
+                    now = time.monotonic()
 
                 self._log.debug(f"Steam subprocesses search timed out (source_pid={request.pid})")
 
@@ -21,6 +21,7 @@ class MouseCursorManager:
         self._process_name = 'unclutter'
         self._cursor_hidden = cursor_hidden
         self._renicing = renicing
+        self._renice_task: Optional[asyncio.Task] = None  # referenced so it is not garbage collected while running
 
     def _gen_custom_env(self, user_env: Optional[Dict[str, str]]):
         env = {**user_env} if user_env else dict(os.environ)
@@ -77,7 +78,7 @@ class MouseCursorManager:
                     self._cursor_hidden = user_request
 
                     if self._renicing:
-                        asyncio.get_event_loop().create_task(self._renice_process())
+                        self._renice_task = asyncio.get_event_loop().create_task(self._renice_process())
 
                     return True
                 else:
@@ -76,7 +76,7 @@ class ProcessesToStopSummarizer(PostProcessSummarizer):
             if summary.pids_to_stop is None:
                 summary.pids_to_stop = set()
 
-            summary.pids_to_stop.update({pid for pid in process.related_pids if pid in summary.pids_alive})
+            summary.pids_to_stop.update(summary.pids_alive.intersection(process.related_pids))
 
 
 class MouseCursorStateSummarizer(PostProcessSummarizer):
@@ -131,17 +131,13 @@ class GPUStateSummarizer(PostProcessSummarizer):
                     summary.gpus_in_use = {}
 
                 for driver, states in process.previous_gpus_states.items():
-                    ids = summary.gpus_in_use.get(driver, set())
-                    ids.update({s.id for s in states})
-                    summary.gpus_in_use[driver] = ids
+                    summary.gpus_in_use.setdefault(driver, set()).update(s.id for s in states)
             else:
                 if summary.previous_gpus_states is None:
                     summary.previous_gpus_states = {}
 
                 for driver, gpus_states in process.previous_gpus_states.items():
-                    states = summary.previous_gpus_states.get(driver, [])
-                    summary.previous_gpus_states[driver] = states
-                    states.extend(gpus_states)
+                    summary.previous_gpus_states.setdefault(driver, []).extend(gpus_states)
 
 
 class ProcessesToRelaunchSummarizer(PostProcessSummarizer):
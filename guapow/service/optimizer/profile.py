@@ -306,10 +306,7 @@ class OptimizationProfile(ProfileFile):
     def from_optimizer_config(cls, config: OptimizerConfig) -> Optional["OptimizationProfile"]:
         if config and config.cpu_performance:
             profile = cls.empty(None)
-
-            if config.cpu_performance:
-                profile.cpu = CPUSettings(True)
-
+            profile.cpu = CPUSettings(True)
             return profile
 
 
@@ -3,8 +3,6 @@ import os
 from logging import Logger
 from typing import Optional
 
-from guapow.common import system
-
 
 class Renicer:
 
@@ -46,17 +44,16 @@ class Renicer:
             if not self._pid_nice:
                 break
 
-            pids = system.read_current_pids()
             dead_pids = set()
 
-            for pid, nice_request in self._pid_nice.items():
-                level, request_pid = nice_request[0], nice_request[1]
-                if pid not in pids:
-                    dead_pids.add(pid)
-
+            for pid, (level, request_pid) in self._pid_nice.items():
                 current_nice = self.get_priority(pid)
 
-                if current_nice != nice_request[0]:
+                if current_nice is None:  # the process is not alive anymore
+                    dead_pids.add(pid)
+                    continue
+
+                if current_nice != level:
                     self._log.debug(
                         f"Process {pid} current nice level ({current_nice}) differs from expected ({level}) "
                         f"(request={request_pid})")
@@ -1,6 +1,5 @@
 import asyncio
 from asyncio import Lock
-from copy import deepcopy
 from typing import Optional, List, Set, Dict
 
 from guapow.common import system
@@ -116,7 +115,7 @@ class DeadProcessWatcher:
 
     def get_to_relaunch_view(self) -> Optional[Dict[str, str]]:
         if self._to_relaunch is not None:
-            return deepcopy(self._to_relaunch)
+            return {**self._to_relaunch}  # names and commands are immutable strings, so a shallow copy is enough
 
 
 class DeadProcessWatcherManager:
@@ -1,10 +1,15 @@
 import asyncio
+import logging
 import os
 from typing import Iterable, Optional, Any, List
 
 TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 RESOURCES_DIR = f'{TESTS_DIR}/resources'
 
+NULL_LOGGER = logging.getLogger('guapow.tests.null')  # for tests that do not check the logging calls
+NULL_LOGGER.addHandler(logging.NullHandler())
+NULL_LOGGER.propagate = False
+
 
 class AnyInstance(object):
     def __init__(self, instance_class: type):
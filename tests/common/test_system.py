@@ -10,8 +10,8 @@ from unittest.mock import patch, Mock, AsyncMock, MagicMock, PropertyMock
 from guapow import __app_name__
 from guapow.common import system
 from guapow.common.system import find_pids_by_names, find_commands_by_pids, find_processes_by_command, \
-    find_process_children, map_processes_by_parent, run_async_process, ProcessTimedOutError
-from tests import AsyncIterator, AnyInstance
+    find_process_children, map_processes_by_parent, run_async_process, ProcessTimedOutError, read_processes_by_parent
+from tests import AsyncIterator, AnyInstance, RESOURCES_DIR
 
 
 class FindProcessByNameTest(IsolatedAsyncioTestCase):
@@ -194,10 +194,37 @@ class FindProcessesByCommandTest(IsolatedAsyncioTestCase):
         create_subprocess_shell.assert_awaited_once_with(cmd='ps -Ao pid,args -ww --no-headers --sort=-pid', stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
 
 
+class ReadProcessesByParentTest(TestCase):
+
+    def test__must_map_processes_by_parent_from_stat_files(self):
+        proc_map = read_processes_by_parent(f'{RESOURCES_DIR}/proc')
+
+        expected = {0: {(1, "systemd")},
+                    1: {(5202, "reaper"), (77, "g\ufffd\ufffdme")},  # invalid UTF-8 bytes in the name are replaced
+                    5202: {(5203, "pv-bwrap")},
+                    5203: {(8708, "Game (x64).exe"), (8710, "Game thread <defunct>")}}
+        self.assertEqual(expected, proc_map)
+
+    def test__must_return_none_when_proc_dir_cannot_be_read(self):
+        self.assertIsNone(read_processes_by_parent(f'{RESOURCES_DIR}/proc_not_available'))
+
+
 class MapProcessByParentTest(IsolatedAsyncioTestCase):
 
     @patch(f"{__app_name__}.common.system.async_syscall")
-    async def test_map_processes_by_parent(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.common.system.read_processes_by_parent", return_value={1: {(5202, "reaper")}})
+    async def test_map_processes_by_parent__must_not_call_ps_when_proc_can_be_read(self, *mocks: Mock):
+        read_processes_by_parent_, async_syscall = mocks
+
+        proc_map = await map_processes_by_parent()
+        self.assertEqual({1: {(5202, "reaper")}}, proc_map)
+        read_processes_by_parent_.assert_called_once()
+        async_syscall.assert_not_awaited()
+
+    @patch(f"{__app_name__}.common.system.async_syscall")
+    @patch(f"{__app_name__}.common.system.read_processes_by_parent", return_value=None)
+    async def test_map_processes_by_parent__must_call_ps_when_proc_cannot_be_read(self, *mocks: Mock):
+        async_syscall = mocks[1]
         async_syscall.return_value = (0, """
         1411    5202 reaper
         5202    5203 pv-bwrap
@@ -209,7 +236,7 @@ class MapProcessByParentTest(IsolatedAsyncioTestCase):
         """)
 
         proc_map = await map_processes_by_parent()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
+        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers", shell=False)
         self.assertEqual(4, len(proc_map))
 
         expected = {1411: {(5202, "reaper")},
@@ -279,16 +306,34 @@ class AsyncProcessMock:
         return self.returncode
 
 
+class AsyncSyscallTest(IsolatedAsyncioTestCase):
+
+    @patch(f"{__app_name__}.common.system.asyncio.create_subprocess_exec")
+    async def test__must_execute_the_command_arguments_without_a_shell_when_shell_is_false(self, *mocks: Mock):
+        create_subprocess_exec = mocks[0]
+        create_subprocess_exec.return_value = Mock(stdout=AsyncIterator([b"1 2 abc\n"]), wait=AsyncMock(),
+                                                   returncode=0)
+
+        code, output = await system.async_syscall("ps -Ao ppid,pid,comm -ww --no-headers", shell=False)
+        self.assertEqual(0, code)
+        self.assertEqual("1 2 abc\n", output)
+
+        create_subprocess_exec.assert_called_once_with("ps", "-Ao", "ppid,pid,comm", "-ww", "--no-headers",
+                                                       stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                                       stderr=subprocess.STDOUT)
+
+
 class RunAsyncProcessTest(IsolatedAsyncioTestCase):
 
     @patch(f"{__app_name__}.common.system.asyncio.create_subprocess_shell")
     async def test__raise_exception_when_wait_is_false_and_timeout_is_reached(self, *mocks: Mock):
         create_subprocess_shell = mocks[0]
-        create_subprocess_shell.return_value = AsyncProcessMock(pid=888)
+        create_subprocess_shell.return_value = AsyncProcessMock(pid=888, wait_time=1)
 
         with self.assertRaises(ProcessTimedOutError) as err:
             await run_async_process(cmd="xpto", wait=False, timeout=0.001)
-            self.assertEqual(888, err.exception.pid)
+
+        self.assertEqual(888, err.exception.pid)
 
         create_subprocess_shell.assert_called_once_with(cmd="xpto", stdin=subprocess.DEVNULL,
                                                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
@@ -307,6 +352,16 @@ class RunAsyncProcessTest(IsolatedAsyncioTestCase):
         create_subprocess_shell.assert_called_once_with(cmd="xpto", stdin=subprocess.DEVNULL,
                                                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
 
+    @patch(f"{__app_name__}.common.system.asyncio.create_subprocess_shell")
+    async def test__return_output_when_process_finishes_before_the_timeout(self, *mocks: Mock):
+        create_subprocess_shell = mocks[0]
+        create_subprocess_shell.return_value = AsyncProcessMock(pid=888, returncode=0, output="xpto", wait_time=0.01)
+
+        pid, code, output = await run_async_process(cmd="xpto", wait=False, timeout=5)
+        self.assertEqual(888, pid)
+        self.assertEqual(0, code)
+        self.assertEqual("xpto", output)
+
     @patch(f"{__app_name__}.common.system.asyncio.create_subprocess_shell")
     async def test__return_output_when_output_true_and_wait_true(self, *mocks: Mock):
         create_subprocess_shell = mocks[0]
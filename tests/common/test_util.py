@@ -26,6 +26,10 @@ class MapAnyRegexTest(TestCase):
         self.assertEqual(r'^\\.*Win64\\MVCI\.exe$', regex.pattern)
         self.assertIsNotNone(regex.match(r'\path\to\Win64\MVCI.exe'))
 
+    def test_map_any_regex__should_return_the_same_pattern_for_a_word_already_mapped(self):
+        regex = util.map_any_regex('game_x86_64.bin')
+        self.assertIs(regex, util.map_any_regex('game_x86_64.bin'))
+
 
 class MapOnlyAnyRegex(TestCase):
 
@@ -2,7 +2,7 @@ import os
 import re
 import sys
 import traceback
-from asyncio import Future, Lock
+from asyncio import Lock
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch, MagicMock, AsyncMock, PropertyMock
 
@@ -350,8 +350,7 @@ class DisableWindowCompositorTest(IsolatedAsyncioTestCase):
         compositor = MagicMock()
         self.context.compositor = compositor
 
-        compositor.is_enabled = MagicMock(return_value=Future())
-        compositor.is_enabled.return_value.set_result(None)
+        compositor.is_enabled = AsyncMock(return_value=None)
 
         await self.task.run(self.process)
         self.assertIsNone(self.context.compositor_disabled_context)
@@ -364,11 +363,9 @@ class DisableWindowCompositorTest(IsolatedAsyncioTestCase):
         compositor = MagicMock()
         self.context.compositor = compositor
 
-        compositor.is_enabled = MagicMock(return_value=Future())
-        compositor.is_enabled.return_value.set_result(True)
+        compositor.is_enabled = AsyncMock(return_value=True)
 
-        compositor.disable = MagicMock(return_value=Future())
-        compositor.disable.return_value.set_result(False)
+        compositor.disable = AsyncMock(return_value=False)
 
         await self.task.run(self.process)
         self.assertIsNone(self.context.compositor_disabled_context)
@@ -381,8 +378,7 @@ class DisableWindowCompositorTest(IsolatedAsyncioTestCase):
         compositor = MagicMock()
         self.context.compositor = compositor
 
-        compositor.is_enabled = MagicMock(return_value=Future())
-        compositor.is_enabled.return_value.set_result(False)
+        compositor.is_enabled = AsyncMock(return_value=False)
 
         compositor.disable = MagicMock()
 
@@ -399,8 +395,7 @@ class DisableWindowCompositorTest(IsolatedAsyncioTestCase):
         previous_disabled_state = {'a': 1}
         self.context.compositor_disabled_context = previous_disabled_state
 
-        compositor.is_enabled = MagicMock(return_value=Future())
-        compositor.is_enabled.return_value.set_result(False)
+        compositor.is_enabled = AsyncMock(return_value=False)
         compositor.disable = MagicMock()
 
         exp_context = {}
@@ -420,11 +415,9 @@ class DisableWindowCompositorTest(IsolatedAsyncioTestCase):
         previous_disabled_context = {'a': 1}
         self.context.compositor_disabled_context = previous_disabled_context
 
-        compositor.is_enabled = MagicMock(return_value=Future())
-        compositor.is_enabled.return_value.set_result(True)
+        compositor.is_enabled = AsyncMock(return_value=True)
 
-        compositor.disable = MagicMock(return_value=Future())
-        compositor.disable.return_value.set_result(True)
+        compositor.disable = AsyncMock(return_value=True)
 
         await self.task.run(self.process)
         self.assertIsNotNone(self.context.compositor_disabled_context)
@@ -1,13 +1,54 @@
-from typing import Set, Optional
+from typing import Set, AsyncIterable, Iterable, AsyncGenerator, TypeVar, Tuple
+import asyncio
+from types import MappingProxyType
 from unittest import IsolatedAsyncioTestCase, TestCase
-from unittest.mock import Mock, patch, AsyncMock, call
+from unittest.mock import Mock, patch, AsyncMock, MagicMock, call
 
 from guapow import __app_name__
 from guapow.common.dto import OptimizationRequest
 from guapow.service.optimizer.launcher import map_launchers_file, gen_possible_launchers_file_paths, \
-    LauncherSearchMode, map_launchers_dict, ExplicitLauncherMapper, SteamLauncherMapper, LauncherMapperManager
+    LauncherSearchMode, map_launchers_dict, ExplicitLauncherMapper, SteamLauncherMapper, LauncherMapperManager, \
+    ProcessesByParentSnapshot
 from guapow.service.optimizer.profile import OptimizationProfile, LauncherSettings
-from tests import RESOURCES_DIR, AsyncIterator, MockedAsyncCall
+from tests import RESOURCES_DIR, MockedAsyncCall, NULL_LOGGER
+
+
+T = TypeVar('T')
+
+STEAM_NATIVE_CMD = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=999999 -- " \
+                   "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
+                   "/media/hd0/Steam/steamapps/common/Game/ABC.x86_"
+
+STEAM_PROTON_CONTAINER_CMD = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=622020 -- " \
+                             "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
+                             "/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/" \
+                             "_v2-entry-point --verb=waitforexitandrun -- " \
+                             "/home/user/.local/share/Steam/steamapps/common/Proton 7.0/proton " \
+                             "waitforexitandrun /media/ssd_02/Steam/steamapps/common/Game Abc & def/ABC.exe"
+
+
+async def async_iter(items: Iterable[T]) -> AsyncGenerator[T, None]:
+    for item in items:
+        yield item
+
+
+async def collect_pids(pids: AsyncIterable[int]) -> Set[int]:
+    return {pid async for pid in pids}
+
+
+class FakeClock:
+    """
+    Monotonic clock only advanced by the (mocked) sleep calls
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, secs: float):
+        self.now += secs
 
 
 def new_steam_profile(enabled: bool) -> OptimizationProfile:
@@ -21,31 +62,31 @@ class MapLaunchersDict(TestCase):
     def test__return_a_command_mapping_for_strings_starting_with_c_followed_by_percentage(self):
         launchers = {' comm ': ' c%c%xpto/abc/tralala --123 --456=978 '}
 
-        res = map_launchers_dict(launchers, Mock())
+        res = map_launchers_dict(launchers, NULL_LOGGER)
         self.assertEqual({'comm': ('c%xpto/abc/tralala --123 --456=978', LauncherSearchMode.COMMAND)}, res)
 
     def test__return_a_command_mapping_for_strings_starting_with_upper_c_followed_by_percentage(self):
         launchers = {' comm ': ' C%C%xpto/abc/tralala --123 --456=978 '}
 
-        res = map_launchers_dict(launchers, Mock())
+        res = map_launchers_dict(launchers, NULL_LOGGER)
         self.assertEqual({'comm': ('C%xpto/abc/tralala --123 --456=978', LauncherSearchMode.COMMAND)}, res)
 
     def test__return_a_name_mapping_for_strings_starting_with_n_followed_by_percentage(self):
         launchers = {' app ': ' n%n%xpto/abc/tralala --123 --456=978 '}
 
-        res = map_launchers_dict(launchers, Mock())
+        res = map_launchers_dict(launchers, NULL_LOGGER)
         self.assertEqual({'app': ('n%xpto/abc/tralala --123 --456=978', LauncherSearchMode.NAME)}, res)
 
     def test__return_a_name_mapping_for_strings_not_starting_with_forward_slash(self):
         launchers = {' app ': ' xpto/abc/tralala --123 --456=978 '}
 
-        res = map_launchers_dict(launchers, Mock())
+        res = map_launchers_dict(launchers, NULL_LOGGER)
         self.assertEqual({'app': ('xpto/abc/tralala --123 --456=978', LauncherSearchMode.NAME)}, res)
 
     def test__return_a_command_mapping_for_strings_starting_with_forward_slash(self):
         launchers = {' app ': ' /xpto/abc/tralala --123 --456=978 '}
 
-        res = map_launchers_dict(launchers, Mock())
+        res = map_launchers_dict(launchers, NULL_LOGGER)
         self.assertEqual({'app': ('/xpto/abc/tralala --123 --456=978', LauncherSearchMode.COMMAND)}, res)
 
 
@@ -60,32 +101,35 @@ class LauncherSearchModeTest(TestCase):
         self.assertEqual(LauncherSearchMode.NAME, returned_type)
 
 
+EXPECTED_VALID_LAUNCHERS = MappingProxyType({'BootGGXrd.bat': ('GuiltyGearXrd.e', LauncherSearchMode.NAME),
+                                             'xpto': ('abcd.exe', LauncherSearchMode.COMMAND),
+                                             '1234': ('5678', LauncherSearchMode.NAME),
+                                             '_a1d3': ('trala-la', LauncherSearchMode.NAME),
+                                             'rrr': ('/usr/bin/program', LauncherSearchMode.COMMAND)})
+
+EXPECTED_COMMENTED_LAUNCHERS = MappingProxyType({'BootGGXrd.bat': ('GuiltyGearXrd.e', LauncherSearchMode.NAME),
+                                                 'aaa': ('bb', LauncherSearchMode.NAME)})
+
+
 class MapLaunchersFileTest(IsolatedAsyncioTestCase):
 
     async def test_map_launchers__it_should_map_valid_definitions(self):
         launcher_file = f'{RESOURCES_DIR}/valid_launchers'
 
-        launchers = await map_launchers_file(launcher_file, Mock())
+        launchers = await map_launchers_file(launcher_file, NULL_LOGGER)
         self.assertIsNotNone(launchers)
+        self.assertEqual(EXPECTED_VALID_LAUNCHERS, launchers)
 
-        expected_mapping = {'BootGGXrd.bat': ('GuiltyGearXrd.e', LauncherSearchMode.NAME),
-                            'xpto': ('abcd.exe', LauncherSearchMode.COMMAND),
-                            '1234': ('5678', LauncherSearchMode.NAME),
-                            '_a1d3': ('trala-la', LauncherSearchMode.NAME),
-                            'rrr': ('/usr/bin/program', LauncherSearchMode.COMMAND)}
-
-        self.assertEqual(expected_mapping, launchers)
-
-    async def test_map_launchers__it_should_ignore_sharps(self):
-        launcher_file = f'{RESOURCES_DIR}/launchers_and_comments'
+    @patch(f'{__app_name__}.service.optimizer.launcher.aiofiles.open')
+    async def test_map_launchers__it_should_ignore_sharps(self, aiofiles_open: MagicMock):
+        lines = ["BootGGXrd.bat=GuiltyGearXrd.e  # Guilty Gear Xrd\n", "#xpto=abc\n", "x#=abc\n",
+                 "tralala=#hahaha\n", "aaa=bb#x\n"]
+        aiofiles_open.return_value.__aenter__.return_value = async_iter(lines)
 
-        launchers = await map_launchers_file(launcher_file, Mock())
+        launchers = await map_launchers_file('/launchers', NULL_LOGGER)
+        aiofiles_open.assert_called_once_with('/launchers')
         self.assertIsNotNone(launchers)
-
-        expected_mapping = {'BootGGXrd.bat': ('GuiltyGearXrd.e', LauncherSearchMode.NAME),
-                            'aaa': ('bb', LauncherSearchMode.NAME)}
-
-        self.assertEqual(expected_mapping, launchers)
+        self.assertEqual(EXPECTED_COMMENTED_LAUNCHERS, launchers)
 
 
 class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
@@ -93,20 +137,47 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
     def setUp(self):
         self.logger = Mock()
         self.mapper = ExplicitLauncherMapper(check_time=0.1, found_check_time=0, logger=self.logger)
+        self.request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
+        self.profile = new_steam_profile(enabled=False)
 
     @patch(f'{__app_name__}.service.optimizer.launcher.map_launchers_file', side_effect=FileNotFoundError)
     async def test_map_pids__it_should_not_yield_when_no_launcher_files_available(self, map_launchers: Mock):
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        self.assertFalse(await map_pids())
+        self.assertFalse(await collect_pids(self.mapper.map_pids(self.request, self.profile)))
 
         exp_file_paths = gen_possible_launchers_file_paths(user_id=123, user_name='user')
         map_launchers.assert_has_calls([call(fpath, self.logger) for fpath in exp_file_paths])
 
+    @patch(f'{__app_name__}.service.optimizer.launcher.map_launchers_file', side_effect=FileNotFoundError)
+    async def test_map_pids__it_should_not_check_again_launcher_files_not_found_before_ttl(self, map_launchers: Mock):
+        self.assertFalse(await collect_pids(self.mapper.map_pids(self.request, self.profile)))
+        first_await_count = map_launchers.await_count
+        self.assertGreater(first_await_count, 0)
+
+        self.assertFalse(await collect_pids(self.mapper.map_pids(self.request, self.profile)))
+        self.assertEqual(first_await_count, map_launchers.await_count)
+
+    @patch(f'{__app_name__}.service.optimizer.launcher.time.monotonic', side_effect=[100, 129.9, 130])
+    def test_is_known_missing_file__must_expire_entries_by_the_monotonic_clock(self, monotonic: Mock):
+        self.mapper = ExplicitLauncherMapper(check_time=0.1, found_check_time=0, logger=self.logger,
+                                             missing_file_ttl=30)
+        file_path = '/launchers'
+        self.mapper._missing_files[file_path] = monotonic() + 30
+
+        self.assertTrue(self.mapper._is_known_missing_file(file_path))
+        self.assertFalse(self.mapper._is_known_missing_file(file_path))
+        self.assertNotIn(file_path, self.mapper._missing_files)
+
+    @patch(f'{__app_name__}.service.optimizer.launcher.map_launchers_file', side_effect=FileNotFoundError)
+    async def test_map_pids__it_should_check_again_launcher_files_not_found_when_ttl_is_zero(self, map_launchers: Mock):
+        self.mapper = ExplicitLauncherMapper(check_time=0.1, found_check_time=0, logger=self.logger,
+                                             missing_file_ttl=0)
+
+        self.assertFalse(await collect_pids(self.mapper.map_pids(self.request, self.profile)))
+        first_await_count = map_launchers.await_count
+
+        self.assertFalse(await collect_pids(self.mapper.map_pids(self.request, self.profile)))
+        self.assertEqual(first_await_count * 2, map_launchers.await_count)
+
     @patch(f'{__app_name__}.service.optimizer.launcher.map_launchers_file')
     @patch(f'{__app_name__}.service.optimizer.launcher.async_syscall')
     async def test_map_pids__it_should_yield_pid_for_only_one_name_match(self, *mocks: AsyncMock):
@@ -114,13 +185,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         async_syscall.return_value = (0, "456 game_x86_64.bin\n789 other")
         map_launchers.return_value = {"game": ("game_x86_64.bin", LauncherSearchMode.NAME)}
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
 
         exp_file_paths = [*gen_possible_launchers_file_paths(user_id=123, user_name='user')]
         map_launchers.assert_awaited_once_with(exp_file_paths[0], self.logger)
@@ -135,13 +200,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         async_syscall.return_value = (0, "456 game_x86_64.bin\n789 other\n1011 game_x86_64.bin")
         map_launchers.return_value = {"game": ("game_x86_64.bin", LauncherSearchMode.NAME)}
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
 
         exp_file_paths = [*gen_possible_launchers_file_paths(user_id=123, user_name='user')]
         map_launchers.assert_awaited_once_with(exp_file_paths[0], self.logger)
@@ -157,13 +216,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         map_launchers.side_effect = [FileNotFoundError, {'game': ('game_x86_64.bin', LauncherSearchMode.NAME)}]
         async_syscall.return_value = (0, "456 game_x86_64.bin\n789 other\n")
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
 
         exp_file_paths = [*gen_possible_launchers_file_paths(user_id=123, user_name='user')]
         map_launchers.assert_has_calls([call(fpath, self.logger) for fpath in exp_file_paths])
@@ -183,15 +236,12 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
 
         profile = new_steam_profile(enabled=False)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
 
         map_launchers.assert_awaited_once_with(f'/etc/{__app_name__}/launchers', self.logger)
         async_syscall.assert_awaited_with('ps -Ao pid,comm -ww --no-headers')
 
-        self.assertEqual(mapped_pids, await map_pids())
+        self.assertEqual(mapped_pids, await collect_pids(self.mapper.map_pids(request, profile)))
 
     @patch(f'{__app_name__}.service.optimizer.launcher.map_launchers_file')
     @patch(f'{__app_name__}.service.optimizer.launcher.async_syscall')
@@ -201,13 +251,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         map_launchers.return_value = {'game': ('/path/to/game_x86_64.bin', LauncherSearchMode.COMMAND)}
         async_syscall.return_value = (0, "456 /path/to/game_x86_64.bin\n789 other\n")
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
         map_launchers.assert_awaited_once()
         async_syscall.assert_awaited_once_with('ps -Ao pid,args -ww --no-headers')
 
@@ -221,13 +265,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         map_launchers.return_value = {'game': (' *game_x86_64.bin ', LauncherSearchMode.NAME)}
         async_syscall.return_value = (0, "456 /game_x86_64.bin\n789 other\n")
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
 
         exp_file_paths = [*gen_possible_launchers_file_paths(user_id=123, user_name='user')]
         map_launchers.assert_awaited_once_with(exp_file_paths[0], self.logger)
@@ -243,13 +281,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         map_launchers.return_value = {'game': ('/*game_x86_64.bin ', LauncherSearchMode.COMMAND)}
         async_syscall.return_value = (0, "456 /game_x86_64.bin\n789 other\n")
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
 
         map_launchers.assert_awaited_once()
         async_syscall.assert_awaited_once_with('ps -Ao pid,args -ww --no-headers')
@@ -268,10 +300,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=123, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=False)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
 
         map_launchers.assert_awaited_once()
         async_syscall.assert_awaited_once_with('ps -Ao pid,comm -ww --no-headers')
@@ -286,10 +315,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         profile = OptimizationProfile.empty('test')
         profile.launcher = LauncherSettings({'proc1': 'c%/bin/proc_abc'}, None)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
 
         async_syscall.assert_awaited_once_with('ps -Ao pid,args -ww --no-headers')
         self.assertEqual({456}, mapped_pids)
@@ -303,10 +329,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         profile = OptimizationProfile.empty('test')
         profile.launcher = LauncherSettings({'proc1': 'c%/bin/proc_*'}, False)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
 
         async_syscall.assert_awaited_once_with('ps -Ao pid,args -ww --no-headers')
         self.assertEqual({456}, mapped_pids)
@@ -319,10 +342,7 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         profile = OptimizationProfile.empty('test')
         profile.launcher = LauncherSettings({'proc1': ''}, None)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
 
         async_syscall.assert_not_awaited()
         self.assertEqual(set(), mapped_pids)
@@ -333,11 +353,20 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
         profile = OptimizationProfile.empty('test')
         profile.launcher = LauncherSettings({'proc1': '/bin/proc1'}, True)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
 
-        mapped_pids = await map_pids()
+        async_syscall.assert_not_awaited()
+        self.assertEqual(set(), mapped_pids)
+
+    @patch(f'{__app_name__}.service.optimizer.launcher.map_launchers_file')
+    @patch(f'{__app_name__}.service.optimizer.launcher.async_syscall')
+    async def test_map_pids__it_should_not_read_launchers_files_when_skip_mapping_is_true(self, *mocks: AsyncMock):
+        async_syscall, map_launchers = mocks[0], mocks[1]
+        self.profile.launcher = LauncherSettings(None, True)
 
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
+
+        map_launchers.assert_not_awaited()
         async_syscall.assert_not_awaited()
         self.assertEqual(set(), mapped_pids)
 
@@ -353,16 +382,10 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
 
         map_launchers.return_value = {"game": ("game_x86_64.bin", LauncherSearchMode.NAME)}
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
         self.mapper = ExplicitLauncherMapper(check_time=0.1, found_check_time=-1, iteration_sleep_time=0,
                                              logger=self.logger)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
 
         exp_file_paths = [*gen_possible_launchers_file_paths(user_id=123, user_name='user')]
         map_launchers.assert_awaited_once_with(exp_file_paths[0], self.logger)
@@ -381,17 +404,11 @@ class ExplicitLauncherMapperTest(IsolatedAsyncioTestCase):
 
         map_launchers.return_value = {"game": ("game_x86_64.bin", LauncherSearchMode.NAME)}
 
-        request = OptimizationRequest(pid=123, command='/usr/local/bin/game', user_name='user')
-        profile = new_steam_profile(enabled=False)
-
         # setting 'found_check_time' to zero, so the next iteration wouldn't happen
         self.mapper = ExplicitLauncherMapper(check_time=1, found_check_time=0, iteration_sleep_time=0,
                                              logger=self.logger)
 
-        async def map_pids() -> Set[int]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
+        mapped_pids = await collect_pids(self.mapper.map_pids(self.request, self.profile))
 
         exp_file_paths = [*gen_possible_launchers_file_paths(user_id=123, user_name='user')]
         map_launchers.assert_awaited_once_with(exp_file_paths[0], self.logger)
@@ -405,37 +422,27 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
 
     def setUp(self):
         self.mapper = SteamLauncherMapper(check_time=0.1, found_check_time=0, iteration_sleep_time=0,
-                                          logger=Mock())
-
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-            1403    2601 reaper
-            2601    2602 ABC.x86_
-            2601    2603 ABC.x86_-thread
-    """))
-    async def test_map_pids__yield_several_ids_when_native_command_not_from_runtime(self, async_syscall: AsyncMock):
-        cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=999999 -- " \
-              "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
-              "/media/hd0/Steam/steamapps/common/Game/ABC.x86_"
+                                          logger=NULL_LOGGER)
+
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1403: {(2601, "reaper")},
+                         2601: {(2602, "ABC.x86_"), (2603, "ABC.x86_-thread")}})
+    async def test_map_pids__yield_several_ids_when_native_command_not_from_runtime(self, map_processes_by_parent: AsyncMock):
+        cmd = STEAM_NATIVE_CMD
 
         request = OptimizationRequest(pid=2601, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({2602, 2603}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-       1403    11573 reaper
-       11573   11574 pv-bwrap
-       11574   11728 pressure-vessel
-       11728   13786 ABC.x86_
-       11728   13787 ABC.x86_-thread
-    """))
-    async def test_map_pids__yield_several_ids_when_native_command_from_runtime(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1403: {(11573, "reaper")},
+                         11573: {(11574, "pv-bwrap")},
+                         11574: {(11728, "pressure-vessel")},
+                         11728: {(13786, "ABC.x86_"), (13787, "ABC.x86_-thread")}})
+    async def test_map_pids__yield_several_ids_when_native_command_from_runtime(self, map_processes_by_parent: AsyncMock):
         cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=245170 -- " \
               "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
               "/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point " \
@@ -446,21 +453,15 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=11573, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({13786, 13787}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        1435    5614 reaper
-        5614    5615 python3
-        5615    5661 Game_x64.exe
-        5615    5662 Game_x64-thread
-    """))
-    async def test_map_pids__yield_several_ids_when_proton_command_not_from_runtime(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1435: {(5614, "reaper")},
+                         5614: {(5615, "python3")},
+                         5615: {(5661, "Game_x64.exe"), (5662, "Game_x64-thread")}})
+    async def test_map_pids__yield_several_ids_when_proton_command_not_from_runtime(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/Proton 3.16/proton waitforexitandrun ' \
               '/home/user/.local/share/Steam/steamapps/common/Game II/Game_x64.exe'
@@ -468,29 +469,22 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=5614, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({5661, 5662}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall")
-    async def test_map_pids__yield_several_ids_when_proton_command_from_runtime(self, async_syscall: AsyncMock):
-        mocked_call = MockedAsyncCall(results=[(0, """12 123  reaper
-                                                      123 456   pv-bwrap
-                                                      456  789   pressure-vessel
-                                                      789  1011 python3
-                                                      789  1213 Game_x64.exe"""),
-                                               (0, """12 123  reaper
-                                                      123 456   pv-bwrap
-                                                      456  789   pressure-vessel
-                                                      789  1011 python3
-                                                      789  1213 Game_x64.exe
-                                                      789  1214 Game_x64-thread""")  # one more child found
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent")
+    async def test_map_pids__yield_several_ids_when_proton_command_from_runtime(self, map_processes_by_parent: AsyncMock):
+        mocked_call = MockedAsyncCall(results=[{12: {(123, "reaper")},
+                                                123: {(456, "pv-bwrap")},
+                                                456: {(789, "pressure-vessel")},
+                                                789: {(1011, "python3"), (1213, "Game_x64.exe")}},
+                                               {12: {(123, "reaper")},
+                                                123: {(456, "pv-bwrap")},
+                                                456: {(789, "pressure-vessel")},
+                                                789: {(1011, "python3"), (1213, "Game_x64.exe"), (1214, "Game_x64-thread")}}  # one more child found
                                                ])
-        async_syscall.side_effect = mocked_call.call
+        map_processes_by_parent.side_effect = mocked_call.call
 
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
@@ -500,46 +494,20 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
 
         self.mapper = SteamLauncherMapper(check_time=0.5,  # using a higher wait time for this test case
                                           found_check_time=-1,
-                                          logger=Mock())
+                                          logger=NULL_LOGGER)
         request = OptimizationRequest(pid=123, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 2)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 2)
         self.assertEqual({1213, 1214}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        1435    5614 reaper
-        5614    30324 pv-bwrap
-        30324   30408 pressure-vessel
-        30408    5615 python3
-        30408    5676 wineserver
-        30408    5711 services.exe
-        30408    5745 winedevice.exe
-        30408    5760 plugplay.exe
-        30408    5765 winedevice.exe
-        30408    5774 explorer.exe
-        30408    5775 OriginWebHelper
-        30408    5776 Origin.exe
-        30408    5777 OriginClientSer
-        30408    5778 QtWebEngineProc
-        30408    5779 EASteamProxy.ex
-        30408    5780 PnkBstrA.exe
-        30408    5781 UPlayBrowser.exe
-        30408    5782 wine
-        30408    5783 wine64
-        30408    5784 winemenubuilder
-        30408    5785 proton
-        30408    5786 gzip
-        30408    5787 steam.exe
-        30408    5788 python 
-        30408    5661 Game_x64.exe
-    """))
-    async def test_map_pids__should_not_yield_ignored_processes(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1435: {(5614, "reaper")},
+                         5614: {(30324, "pv-bwrap")},
+                         30324: {(30408, "pressure-vessel")},
+                         30408: {(5615, "python3"), (5676, "wineserver"), (5711, "services.exe"), (5745, "winedevice.exe"), (5760, "plugplay.exe"), (5765, "winedevice.exe"), (5774, "explorer.exe"), (5775, "OriginWebHelper"), (5776, "Origin.exe"), (5777, "OriginClientSer"), (5778, "QtWebEngineProc"), (5779, "EASteamProxy.ex"), (5780, "PnkBstrA.exe"), (5781, "UPlayBrowser.exe"), (5782, "wine"), (5783, "wine64"), (5784, "winemenubuilder"), (5785, "proton"), (5786, "gzip"), (5787, "steam.exe"), (5788, "python"), (5661, "Game_x64.exe")}})
+    async def test_map_pids__should_not_yield_ignored_processes(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
               '--verb=waitforexitandrun -- ' \
@@ -549,25 +517,18 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=5614, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({5661}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        1435    5614 reaper
-        5614    30324 pv-bwrap
-        30324   30408 pressure-vessel
-        30408    5615 python3
-        30408    5676 wineserver
-        30408    5661 Game_x64.exe
-        5661     5662 wine64
-        5662     5663 wineboot.exe
-    """))
-    async def test_map_pids__should_not_yield_ignored_that_are_children_of_targets(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1435: {(5614, "reaper")},
+                         5614: {(30324, "pv-bwrap")},
+                         30324: {(30408, "pressure-vessel")},
+                         30408: {(5615, "python3"), (5676, "wineserver"), (5661, "Game_x64.exe")},
+                         5661: {(5662, "wine64")},
+                         5662: {(5663, "wineboot.exe")}})
+    async def test_map_pids__should_not_yield_ignored_that_are_children_of_targets(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
               '--verb=waitforexitandrun -- ' \
@@ -577,22 +538,16 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=5614, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({5661}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        1435    5614 reaper
-        5614    30324 pv-bwrap
-        30324   30408 pressure-vessel
-        30408    5661 Game_x64.exe
-        30408    5662 Game_thread <defunct>
-    """))
-    async def test_map_pids__should_not_yield_defunct_processes(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1435: {(5614, "reaper")},
+                         5614: {(30324, "pv-bwrap")},
+                         30324: {(30408, "pressure-vessel")},
+                         30408: {(5661, "Game_x64.exe"), (5662, "Game_thread <defunct>")}})
+    async def test_map_pids__should_not_yield_defunct_processes(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
               '--verb=waitforexitandrun -- ' \
@@ -602,24 +557,16 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=5614, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({5661}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        1435    5614 reaper
-        5614    30324 pv-bwrap
-        30324   30408 pressure-vessel
-        30408    5661 Game_x64.exe
-        30408    5662 pressure-vessel
-        30408    5663 pv-bwrap
-        30408    5664 reaper
-    """))
-    async def test_map_pids__should_not_yield_children_with_name_in_hierachy(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1435: {(5614, "reaper")},
+                         5614: {(30324, "pv-bwrap")},
+                         30324: {(30408, "pressure-vessel")},
+                         30408: {(5661, "Game_x64.exe"), (5662, "pressure-vessel"), (5663, "pv-bwrap"), (5664, "reaper")}})
+    async def test_map_pids__should_not_yield_children_with_name_in_hierachy(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
               '--verb=waitforexitandrun -- ' \
@@ -629,24 +576,19 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=5614, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({5661}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        1435    5614 reaper
-        5614    30324 pv-bwrap
-        30324   30408 pressure-vessel
-        30408    5661 Game_x64.exe
-        5661     5662 pressure-vessel
-        5662     5663 pv-bwrap
-        5663     5664 reaper
-    """))
-    async def test_map_pids__should_not_yield_children_of_children_with_name_in_hierachy(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1435: {(5614, "reaper")},
+                         5614: {(30324, "pv-bwrap")},
+                         30324: {(30408, "pressure-vessel")},
+                         30408: {(5661, "Game_x64.exe")},
+                         5661: {(5662, "pressure-vessel")},
+                         5662: {(5663, "pv-bwrap")},
+                         5663: {(5664, "reaper")}})
+    async def test_map_pids__should_not_yield_children_of_children_with_name_in_hierachy(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
               '--verb=waitforexitandrun -- ' \
@@ -656,23 +598,16 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=5614, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({5661}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        12 123  reaper
-        123 456   pv-bwrap
-        456  789   pressure-vessel
-        789  1011 python3
-        789  1213 Game_x64.exe
-        789  1214 Game_x64-thread   
-    """))
-    async def test_map_pids__yield_children_until_timeout_is_reached(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={12: {(123, "reaper")},
+                         123: {(456, "pv-bwrap")},
+                         456: {(789, "pressure-vessel")},
+                         789: {(1011, "python3"), (1213, "Game_x64.exe"), (1214, "Game_x64-thread")}})
+    async def test_map_pids__yield_children_until_timeout_is_reached(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
               '--verb=waitforexitandrun -- ' \
@@ -682,21 +617,16 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=123, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual({1213, 1214}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-        12 123  reaper
-        123 456   pv-bwrap
-        456  789   pressure-vessel
-        789  1011 python3
-    """))
-    async def test_map_pids__yield_nothing_when_no_children_is_found(self, async_syscall: AsyncMock):
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={12: {(123, "reaper")},
+                         123: {(456, "pv-bwrap")},
+                         456: {(789, "pressure-vessel")},
+                         789: {(1011, "python3")}})
+    async def test_map_pids__yield_nothing_when_no_children_is_found(self, map_processes_by_parent: AsyncMock):
         cmd = '/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=123 -- ' \
               '/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point ' \
               '--verb=waitforexitandrun -- ' \
@@ -706,61 +636,106 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         request = OptimizationRequest(pid=123, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
         self.assertEqual(set(), mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall")
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent")
     async def test_map_pids__it_should_stopping_yielding_if_found_check_time_reached(self, *mocks: AsyncMock):
-        async_syscall = mocks[0]
+        map_processes_by_parent = mocks[0]
 
-        async_syscall.side_effect = [(0, "1403    2601 reaper\n2601    2602 ABC.x86_"),
-                                     (0, """1403    2601 reaper
-                                            2601    2602 ABC.x86_
-                                            2601    2603 ABC.x86_-thread""")]
+        map_processes_by_parent.side_effect = [{1403: {(2601, "reaper")},
+                                                2601: {(2602, "ABC.x86_")}},
+                                               {1403: {(2601, "reaper")},
+                                                2601: {(2602, "ABC.x86_"), (2603, "ABC.x86_-thread")}}]
 
-        cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=999999 -- " \
-              "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
-              "/media/hd0/Steam/steamapps/common/Game/ABC.x86_"
+        cmd = STEAM_NATIVE_CMD
 
-        self.mapper = SteamLauncherMapper(check_time=0.1, found_check_time=0, iteration_sleep_time=0.001, logger=Mock())
+        self.mapper = SteamLauncherMapper(check_time=0.1, found_check_time=0, iteration_sleep_time=0.001, logger=NULL_LOGGER)
         request = OptimizationRequest(pid=2601, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
-
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertEqual(1, async_syscall.await_count)
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertEqual(1, map_processes_by_parent.await_count)
         self.assertEqual({2602}, mapped_pids)
 
-    @patch(f"{__app_name__}.common.system.async_syscall", return_value=(0, """
-            1403    2601 reaper
-            2601    2602 ABC.x86_
-            2602    2603 ABC.x86_-thread
-            2603    2604 ABC.x86_-thread-2
-    """))
-    async def test_map_pids__it_should_not_yield_children_of_target_children(self, async_syscall: AsyncMock):
-        cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=999999 -- " \
-              "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
-              "/media/hd0/Steam/steamapps/common/Game/ABC.x86_"
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           return_value={1403: {(2601, "reaper")},
+                         2601: {(2602, "ABC.x86_")},
+                         2602: {(2603, "ABC.x86_-thread")},
+                         2603: {(2604, "ABC.x86_-thread-2")}})
+    async def test_map_pids__it_should_not_yield_children_of_target_children(self, map_processes_by_parent: AsyncMock):
+        cmd = STEAM_NATIVE_CMD
 
         request = OptimizationRequest(pid=2601, command=cmd, user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in self.mapper.map_pids(request, profile)}
+        mapped_pids = await collect_pids(self.mapper.map_pids(request, profile))
+        self.assertGreaterEqual(map_processes_by_parent.await_count, 1)
+        self.assertEqual({2602}, mapped_pids)
+
+    async def _map_pids_with_fake_clock(self, request: OptimizationRequest, clock: FakeClock,
+                                        processes: MockedAsyncCall) -> Tuple[Set[int], Mock]:
+        with patch(f"{__app_name__}.service.optimizer.launcher.time.monotonic", side_effect=clock.monotonic), \
+             patch(f"{__app_name__}.service.optimizer.launcher.asyncio.sleep", side_effect=clock.sleep) as sleep, \
+             patch(f"{__app_name__}.service.optimizer.launcher.ProcessesByParentSnapshot.read",
+                   side_effect=processes.call):
+            mapped_pids = await collect_pids(self.mapper.map_pids(request, new_steam_profile(enabled=True)))
+
+        return mapped_pids, sleep
+
+    async def test_map_pids__it_should_increase_the_sleep_time_while_the_processes_do_not_change(self):
+        self.mapper = SteamLauncherMapper(check_time=5, found_check_time=0, iteration_sleep_time=0.25,
+                                          max_iteration_sleep_time=1, logger=NULL_LOGGER)
+        request = OptimizationRequest(pid=2601, command=STEAM_NATIVE_CMD, user_name='user')
 
-        mapped_pids = await map_pids()
-        async_syscall.assert_awaited_with("ps -Ao ppid,pid,comm -ww --no-headers")
-        self.assertGreaterEqual(async_syscall.await_count, 1)
+        mapped_pids, sleep = await self._map_pids_with_fake_clock(request, FakeClock(),
+                                                                  MockedAsyncCall(results=[{1: {(1403, "reaper")}}]))
+        self.assertEqual(set(), mapped_pids)
+
+        # the latest sleep only lasts the time remaining before the timeout
+        self.assertEqual([call(0.25), call(0.375), call(0.5625), call(0.84375), call(1), call(1), call(0.96875)],
+                         sleep.call_args_list)
+
+    async def test_map_pids__it_should_not_sleep_beyond_the_found_check_time(self):
+        self.mapper = SteamLauncherMapper(check_time=5, found_check_time=0.5, iteration_sleep_time=0.25,
+                                          max_iteration_sleep_time=1, logger=NULL_LOGGER)
+        request = OptimizationRequest(pid=2601, command=STEAM_NATIVE_CMD, user_name='user')
+
+        processes = MockedAsyncCall(results=[{2601: {(2602, "ABC.x86_")}}])
+        mapped_pids, sleep = await self._map_pids_with_fake_clock(request, FakeClock(), processes)
         self.assertEqual({2602}, mapped_pids)
 
+        # the second sleep would be 0.375, but only 0.25 remain before the found check time is reached
+        self.assertEqual([call(0.25), call(0.25)], sleep.call_args_list)
+
+    async def test_map_pids__it_should_reset_the_sleep_time_when_the_searched_processes_change(self):
+        self.mapper = SteamLauncherMapper(check_time=5, found_check_time=0, iteration_sleep_time=0.25,
+                                          max_iteration_sleep_time=1, logger=NULL_LOGGER)
+        request = OptimizationRequest(pid=2601, command=STEAM_NATIVE_CMD, user_name='user')
+
+        processes = MockedAsyncCall(results=[{2601: {(2602, "wineserver")}},
+                                             {2601: {(2602, "wineserver")}},
+                                             {2601: {(2602, "wineserver"), (2603, "wine")}},
+                                             {2601: {(2602, "wineserver"), (2603, "wine")}}])
+
+        mapped_pids, sleep = await self._map_pids_with_fake_clock(request, FakeClock(), processes)
+        self.assertEqual(set(), mapped_pids)
+        self.assertEqual([call(0.25), call(0.375), call(0.25), call(0.375)], sleep.call_args_list[0:4])
+
+    async def test_map_pids__it_should_not_reset_the_sleep_time_when_only_unrelated_processes_change(self):
+        self.mapper = SteamLauncherMapper(check_time=5, found_check_time=0, iteration_sleep_time=0.25,
+                                          max_iteration_sleep_time=1, logger=NULL_LOGGER)
+        request = OptimizationRequest(pid=2601, command=STEAM_NATIVE_CMD, user_name='user')
+
+        processes = MockedAsyncCall(results=[{1: {(1403, "reaper")}},
+                                             {1: {(1403, "reaper"), (1404, "abc")}},
+                                             {1: {(1403, "reaper"), (1404, "abc"), (1405, "def")}}])
+
+        mapped_pids, sleep = await self._map_pids_with_fake_clock(request, FakeClock(), processes)
+        self.assertEqual(set(), mapped_pids)
+        self.assertEqual([call(0.25), call(0.375), call(0.5625)], sleep.call_args_list[0:3])
+
     def test_map_expected_hierarchy__when_proton_command(self):
         cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=443860 -- " \
               "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
@@ -772,11 +747,7 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         self.assertEqual(expected_hierarchy, self.mapper.map_expected_hierarchy(request, "reaper"))
 
     def test_map_expected_hierarchy__when_proton_command_executed_from_container(self):
-        cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=622020 -- " \
-              "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
-              "/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point " \
-              "--verb=waitforexitandrun -- /home/user/.local/share/Steam/steamapps/common/Proton 7.0/proton " \
-              "waitforexitandrun /media/ssd_02/Steam/steamapps/common/Game Abc & def/ABC.exe"
+        cmd = STEAM_PROTON_CONTAINER_CMD
         request = OptimizationRequest(pid=2601, command=cmd, user_name='user')
 
         expected_hierarchy = ["pressure-vessel", "pv-bwrap", "reaper"]
@@ -804,15 +775,32 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         self.assertEqual(expected_hierarchy, self.mapper.map_expected_hierarchy(request, "reaper"))
 
     def test_extract_root_process_name__must_return_the_first_command_call_name(self):
-        cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=622020 -- " \
-              "/home/user/.local/share/Steam/ubuntu12_32/steam-launch-wrapper -- " \
-              "/home/user/.local/share/Steam/steamapps/common/SteamLinuxRuntime_soldier/_v2-entry-point " \
-              "--verb=waitforexitandrun -- /home/user/.local/share/Steam/steamapps/common/Proton 7.0/proton " \
-              "waitforexitandrun /media/ssd_02/Steam/steamapps/common/Game Abc & def/ABC.exe"
+        cmd = STEAM_PROTON_CONTAINER_CMD
 
         root_cmd = self.mapper.extract_root_process_name(cmd)
         self.assertEqual("reaper", root_cmd)
 
+    def test_extract_root_process_name__must_not_parse_a_known_command_again(self):
+        cmd = "/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=622020 -- " \
+              "/media/ssd_02/Steam/steamapps/common/Game/Game.x86_64"
+
+        self.assertEqual("reaper", self.mapper.extract_root_process_name(cmd))
+
+        self.mapper._re_steam_cmd = Mock()
+        self.assertEqual("reaper", self.mapper.extract_root_process_name(cmd))
+        self.mapper._re_steam_cmd.findall.assert_not_called()
+
+    def test_extract_root_process_name__must_discard_the_oldest_command_when_max_cached_reached(self):
+        self.mapper._max_cached_root_names = 2
+
+        for app_id in range(3):
+            cmd = f"/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId={app_id} -- /games/Game.x86_64"
+            self.assertEqual("reaper", self.mapper.extract_root_process_name(cmd))
+
+        self.assertEqual(2, len(self.mapper._root_names))
+        self.assertNotIn("/home/user/.local/share/Steam/ubuntu12_32/reaper SteamLaunch AppId=0 -- /games/Game.x86_64",
+                         self.mapper._root_names)
+
     def test_find_target_in_hierarchy__return_the_root_id_when_just_one_element_hierarchy(self):
         hierarchy = ["reaper"]
         pids_by_comm = dict()
@@ -857,6 +845,19 @@ class SteamLauncherMapperTest(IsolatedAsyncioTestCase):
         self.assertEqual(1011, target_id_second_run)
         self.assertEqual({"pressure-vessel": 1011, "pv-bwrap": 789, "reaper": 456}, pids_by_comm)
 
+    def test_find_target_in_hierarchy__must_not_look_up_again_levels_mapped_on_previous_runs(self):
+        hierarchy = ["pressure-vessel", "pv-bwrap", "reaper"]
+        pids_by_comm = {"pv-bwrap": 789, "reaper": 456}
+
+        # only the missing level children are available
+        processes_by_parent = {789: {(1011, "pressure-vessel")}}
+
+        target_id = self.mapper.find_target_in_hierarchy(reverse_hierarchy=hierarchy, root_element_pid=456,
+                                                         processes_by_parent=processes_by_parent,
+                                                         pid_by_comm=pids_by_comm)
+        self.assertEqual(1011, target_id)
+        self.assertEqual({"pressure-vessel": 1011, "pv-bwrap": 789, "reaper": 456}, pids_by_comm)
+
     def test_find_target_in_hierarchy__return_the_latest_target_child_id_when_multiple_matches(self):
         hierarchy = ["pressure-vessel", "pv-bwrap", "reaper"]
         pids_by_comm = dict()
@@ -911,28 +912,25 @@ class ProcessLauncherManagerTest(IsolatedAsyncioTestCase):
     async def test_map_pids__should_try_to_retrieve_pid_until_a_mapper_returns_a_pid(self):
         # first sub-mapper that would inspect the request, but no process would be returned
         mocked_mapper = Mock()
-        mocked_mapper.map_pids = Mock(return_value=AsyncIterator([]))
+        mocked_mapper.map_pids = Mock(return_value=async_iter([]))
 
         # second sub-mapper that would inspect the request and actually find the process
-        steam_mapper = SteamLauncherMapper(check_time=30, found_check_time=0, logger=Mock())
-        steam_mapper.map_pids = Mock(return_value=AsyncIterator([456]))
+        steam_mapper = SteamLauncherMapper(check_time=0, found_check_time=0, logger=NULL_LOGGER)
+        steam_mapper.map_pids = Mock(return_value=async_iter([456]))
 
-        manager = LauncherMapperManager(check_time=30, found_check_time=0, logger=Mock(),
+        manager = LauncherMapperManager(check_time=0, found_check_time=0, logger=NULL_LOGGER,
                                         mappers=(mocked_mapper, steam_mapper))
 
         request = OptimizationRequest(pid=123, command='/abc', user_name='user')
         profile = new_steam_profile(enabled=True)
 
-        async def map_pids() -> Optional[Set[int]]:
-            return {pid async for pid in manager.map_pids(request, profile)}
-
-        self.assertEqual({456}, await map_pids())
+        self.assertEqual({456}, await collect_pids(manager.map_pids(request, profile)))
 
         mocked_mapper.map_pids.assert_called_once()
         steam_mapper.map_pids.assert_called_once()
 
     async def test_get_sub_mappers__order(self):
-        manager = LauncherMapperManager(check_time=30, found_check_time=0, logger=Mock())
+        manager = LauncherMapperManager(check_time=0, found_check_time=0, logger=NULL_LOGGER)
         mappers = manager.get_sub_mappers()
         self.assertIsNotNone(mappers)
         self.assertEqual(2, len(mappers))
@@ -940,6 +938,35 @@ class ProcessLauncherManagerTest(IsolatedAsyncioTestCase):
         self.assertIsInstance(mappers[1], SteamLauncherMapper)
 
 
+class ProcessesByParentSnapshotTest(IsolatedAsyncioTestCase):
+
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent", return_value={1: {(2, "abc")}})
+    async def test_read__must_reuse_the_processes_read_while_not_expired(self, map_processes_by_parent: AsyncMock):
+        snapshot = ProcessesByParentSnapshot(max_age=30)
+
+        self.assertEqual({1: {(2, "abc")}}, await snapshot.read())
+        self.assertEqual({1: {(2, "abc")}}, await snapshot.read())
+        map_processes_by_parent.assert_awaited_once()
+
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent",
+           side_effect=[{1: {(2, "abc")}}, {1: {(2, "abc"), (3, "def")}}])
+    async def test_read__must_read_the_processes_again_when_expired(self, map_processes_by_parent: AsyncMock):
+        snapshot = ProcessesByParentSnapshot(max_age=0.001)
+
+        self.assertEqual({1: {(2, "abc")}}, await snapshot.read())
+        await asyncio.sleep(0.002)
+        self.assertEqual({1: {(2, "abc"), (3, "def")}}, await snapshot.read())
+        self.assertEqual(2, map_processes_by_parent.await_count)
+
+    @patch(f"{__app_name__}.service.optimizer.launcher.map_processes_by_parent", return_value={1: {(2, "abc")}})
+    async def test_read__must_always_read_the_processes_when_max_age_is_zero(self, map_processes_by_parent: AsyncMock):
+        snapshot = ProcessesByParentSnapshot(max_age=0)
+
+        await snapshot.read()
+        await snapshot.read()
+        self.assertEqual(2, map_processes_by_parent.await_count)
+
+
 class GenPossibleLaunchersFilePathsTest(TestCase):
 
     def test__must_yield_once_the_etc_path_for_root(self):
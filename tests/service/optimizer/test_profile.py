@@ -8,7 +8,7 @@ from guapow.common.profile import StopProcessSettings
 from guapow.service.optimizer.profile import CPUSchedulingPolicy, IOSchedulingClass, CPUSettings, \
     GPUSettings, ProcessSchedulingSettings, ProcessSettings, OptimizationProfileReader, ProcessNiceSettings, \
     OptimizationProfile, OptimizationProfileCache, cache_profiles, IOScheduling
-from tests import RESOURCES_DIR
+from tests import RESOURCES_DIR, NULL_LOGGER
 
 
 class CPUSchedulingPolicyTest(TestCase):
@@ -22,6 +22,10 @@ class CPUSchedulingPolicyTest(TestCase):
     def test_from_str__should_convert_different_cases_string_match(self):
         self.assertEqual(CPUSchedulingPolicy.FIFO, CPUSchedulingPolicy.from_str('FiFo'))
 
+    def test_from_str__should_not_mix_the_cached_values_of_different_enums(self):
+        self.assertEqual(CPUSchedulingPolicy.IDLE, CPUSchedulingPolicy.from_str('idle'))
+        self.assertEqual(IOSchedulingClass.IDLE, IOSchedulingClass.from_str('idle'))
+
     def test_fifo__should_support_priority(self):
         self.assertTrue(CPUSchedulingPolicy.FIFO.requires_priority())
 
@@ -161,8 +165,12 @@ class GPUSettingsTest(TestCase):
 
 class OptimizationProfileReaderTest(IsolatedAsyncioTestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.model_filler = FileModelFiller(NULL_LOGGER)  # it only caches the property mappers, so it can be shared
+
     def setUp(self):
-        self.reader = OptimizationProfileReader(FileModelFiller(Mock()), Mock(), None)
+        self.reader = OptimizationProfileReader(self.model_filler, NULL_LOGGER, None)
 
     async def test_read__return_a_profile_with_only_valid_io_settings_defined(self):
         profile_path = f'{RESOURCES_DIR}/only_valid_io.profile'
@@ -545,7 +553,7 @@ class OptimizationProfileReaderTest(IsolatedAsyncioTestCase):
 
     async def test_read_valid__must_cache_valid_profile_when_cache_is_defined(self):
         profile_path = f'{RESOURCES_DIR}/only_valid_cpu.profile'
-        cache = OptimizationProfileCache(Mock())
+        cache = OptimizationProfileCache(NULL_LOGGER)
         self.reader._cache = cache
 
         self.assertIsNone(cache.get(profile_path, None))
@@ -565,7 +573,7 @@ class OptimizationProfileReaderTest(IsolatedAsyncioTestCase):
         profile_path = f'{RESOURCES_DIR}/only_valid_cpu.profile'
         add_settings = 'compositor.off'
 
-        cache = OptimizationProfileCache(Mock())
+        cache = OptimizationProfileCache(NULL_LOGGER)
         self.reader._cache = cache
 
         self.assertIsNone(cache.get(profile_path, add_settings))
@@ -586,7 +594,7 @@ class OptimizationProfileReaderTest(IsolatedAsyncioTestCase):
 
     async def test_read_valid__must_not_cache_invalid_profile_when_cache_is_defined(self):
         profile_path = f'{RESOURCES_DIR}/gpu_invalid.profile'
-        cache = OptimizationProfileCache(Mock())
+        cache = OptimizationProfileCache(NULL_LOGGER)
         self.reader._cache = cache
 
         self.assertIsNone(cache.get(profile_path, None))
@@ -637,11 +645,11 @@ class CacheProfilesTest(IsolatedAsyncioTestCase):
 
     @patch(f'{__app_name__}.service.optimizer.profile.get_profile_dir', return_value=f'{RESOURCES_DIR}/cache')
     async def test__must_cache_only_valid_profiles(self, get_profile_dir: Mock):
-        cache = OptimizationProfileCache(Mock())
-        reader = OptimizationProfileReader(model_filler=FileModelFiller(Mock()),
-                                           logger=Mock(),
+        cache = OptimizationProfileCache(NULL_LOGGER)
+        reader = OptimizationProfileReader(model_filler=FileModelFiller(NULL_LOGGER),
+                                           logger=NULL_LOGGER,
                                            cache=cache)
-        await cache_profiles(reader, Mock())
+        await cache_profiles(reader, NULL_LOGGER)
         get_profile_dir.assert_has_calls([call(0, 'root'), call(1, '*')], any_order=True)
 
         self.assertEqual(1, cache.size)
@@ -37,9 +37,8 @@ class RenicerTest(IsolatedAsyncioTestCase):
         setpriority.assert_called_once_with(os.PRIO_PROCESS, 789, -2)
 
     @patch(f'{__app_name__}.service.optimizer.renicer.os.setpriority')
-    @patch(f'{__app_name__}.service.optimizer.renicer.os.getpriority', return_value=0)
-    @patch(f'{__app_name__}.service.optimizer.renicer.system.read_current_pids', side_effect=[{1, 2, 3}, {}])   # on the first iteration all watched processes are alive, on the second none
-    async def test_watch__must_set_priority_from_watched_processes_with_priorities_different_from_expected(self, read_current_pids: Mock, get_priority: Mock, set_priority: Mock):
+    @patch(f'{__app_name__}.service.optimizer.renicer.os.getpriority', side_effect=[0, 0, ProcessLookupError, ProcessLookupError])  # on the first iteration all watched processes are alive, on the second none
+    async def test_watch__must_set_priority_from_watched_processes_with_priorities_different_from_expected(self, get_priority: Mock, set_priority: Mock):
         self.renicer.add(1, -1, 1)
         self.renicer.add(2, -2, 2)
 
@@ -52,16 +51,15 @@ class RenicerTest(IsolatedAsyncioTestCase):
         for _ in range(3):
             await asyncio.sleep(0.0001)  # just to generate 3 interruptions for the async task
 
-        self.assertEqual(2, read_current_pids.call_count)
-        get_priority.assert_has_calls([call(os.PRIO_PROCESS, 1), call(os.PRIO_PROCESS, 1)], any_order=True)
+        get_priority.assert_has_calls([call(os.PRIO_PROCESS, 1), call(os.PRIO_PROCESS, 2),
+                                       call(os.PRIO_PROCESS, 1), call(os.PRIO_PROCESS, 2)])
         set_priority.assert_has_calls([call(os.PRIO_PROCESS, 1, -1), call(os.PRIO_PROCESS, 2, -2)])
 
         self.assertFalse(self.renicer.is_watching())
 
     @patch(f'{__app_name__}.service.optimizer.renicer.os.setpriority')
-    @patch(f'{__app_name__}.service.optimizer.renicer.os.getpriority', return_value=-1)
-    @patch(f'{__app_name__}.service.optimizer.renicer.system.read_current_pids', side_effect=[{1, 2, 3}, {}])  # on the first iteration all watched processes are alive, on the second none
-    async def test_watch__must_not_set_priority_from_watched_processes_when_priorities_equal_expected(self, read_current_pids: Mock, get_priority: Mock, set_priority: Mock):
+    @patch(f'{__app_name__}.service.optimizer.renicer.os.getpriority', side_effect=[-1, -1, ProcessLookupError, ProcessLookupError])  # on the first iteration all watched processes are alive, on the second none
+    async def test_watch__must_not_set_priority_from_watched_processes_when_priorities_equal_expected(self, get_priority: Mock, set_priority: Mock):
         self.renicer.add(1, -1, 1)
         self.renicer.add(2, -1, 2)
 
@@ -74,16 +72,15 @@ class RenicerTest(IsolatedAsyncioTestCase):
         for _ in range(3):
             await asyncio.sleep(0.0001)  # just to generate 3 interruptions for the async task
 
-        self.assertEqual(2, read_current_pids.call_count)
-        get_priority.assert_has_calls([call(os.PRIO_PROCESS, 1), call(os.PRIO_PROCESS, 1)], any_order=True)
+        get_priority.assert_has_calls([call(os.PRIO_PROCESS, 1), call(os.PRIO_PROCESS, 2),
+                                       call(os.PRIO_PROCESS, 1), call(os.PRIO_PROCESS, 2)])
         set_priority.assert_not_called()
 
         self.assertFalse(self.renicer.is_watching())
 
     @patch(f'{__app_name__}.service.optimizer.renicer.os.setpriority')
     @patch(f'{__app_name__}.service.optimizer.renicer.os.getpriority')
-    @patch(f'{__app_name__}.service.optimizer.renicer.system.read_current_pids')
-    async def test_watch__must_not_create_another_loop_task_when_already_watching(self, read_current_pids: Mock, get_priority: Mock, set_priority: Mock):
+    async def test_watch__must_not_create_another_loop_task_when_already_watching(self, get_priority: Mock, set_priority: Mock):
         self.renicer.add(1, -1, 1)
         self.renicer._watching = True
 
@@ -95,7 +92,6 @@ class RenicerTest(IsolatedAsyncioTestCase):
 
         await asyncio.sleep(0.0001)  # generate an interruption (if the task were created, the mocks would have calls)
 
-        read_current_pids.assert_not_called()
         get_priority.assert_not_called()
         set_priority.assert_not_called()
 
@@ -103,8 +99,7 @@ class RenicerTest(IsolatedAsyncioTestCase):
 
     @patch(f'{__app_name__}.service.optimizer.renicer.os.setpriority')
     @patch(f'{__app_name__}.service.optimizer.renicer.os.getpriority')
-    @patch(f'{__app_name__}.service.optimizer.renicer.system.read_current_pids')
-    async def test_watch__must_not_start_watching_when_no_processes_to_watch(self, read_current_pids: Mock, get_priority: Mock, set_priority: Mock):
+    async def test_watch__must_not_start_watching_when_no_processes_to_watch(self, get_priority: Mock, set_priority: Mock):
         self.assertFalse(self.renicer.is_watching())
 
         self.assertFalse(self.renicer.watch())
@@ -113,8 +108,24 @@ class RenicerTest(IsolatedAsyncioTestCase):
 
         await asyncio.sleep(0.0001)  # generate an interruption (if the task were created, the mocks would have calls)
 
-        read_current_pids.assert_not_called()
         get_priority.assert_not_called()
         set_priority.assert_not_called()
 
         self.assertFalse(self.renicer.is_watching())
+
+    @patch(f'{__app_name__}.service.optimizer.renicer.os.setpriority')
+    @patch(f'{__app_name__}.service.optimizer.renicer.os.getpriority', side_effect=[0, ProcessLookupError, ProcessLookupError])  # process 2 is dead on the first iteration
+    async def test_watch__must_not_set_priority_of_dead_processes(self, get_priority: Mock, set_priority: Mock):
+        self.renicer.add(1, -1, 1)
+        self.renicer.add(2, -2, 2)
+
+        self.assertTrue(self.renicer.watch())
+
+        for _ in range(3):
+            await asyncio.sleep(0.0001)  # just to generate 3 interruptions for the async task
+
+        get_priority.assert_has_calls([call(os.PRIO_PROCESS, 1), call(os.PRIO_PROCESS, 2), call(os.PRIO_PROCESS, 1)])
+        set_priority.assert_called_once_with(os.PRIO_PROCESS, 1, -1)
+
+        self.assertFalse(self.renicer.is_watching())
+        self.assertEqual({}, self.renicer._pid_nice)
@@ -1,7 +1,6 @@
 import subprocess
-from asyncio import Future
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, MagicMock, AsyncMock, patch, call
 
 from guapow import __app_name__
 from guapow.common.model import ScriptSettings
@@ -18,8 +17,7 @@ class RunScriptsTest(IsolatedAsyncioTestCase):
     async def test_run__must_run_scripts_as_root_when_current_user_is_root_and_root_scripts_are_allowed(self, create_subprocess_shell: Mock, is_root_user: Mock):
         self.task.root_allowed = True
 
-        mocked_proc_wait = MagicMock(return_value=Future())
-        mocked_proc_wait.return_value.set_result(None)
+        mocked_proc_wait = AsyncMock(return_value=None)
 
         create_subprocess_shell.return_value.wait = mocked_proc_wait
 
@@ -37,8 +35,7 @@ class RunScriptsTest(IsolatedAsyncioTestCase):
     async def test_run__must_not_run_scripts_as_root_when_current_user_is_root_and_root_scripts_are_forbidden(self, create_subprocess_shell: Mock, is_root_user: Mock):
         self.task.root_allowed = False
 
-        mocked_proc_wait = MagicMock(return_value=Future())
-        mocked_proc_wait.return_value.set_result(None)
+        mocked_proc_wait = AsyncMock(return_value=None)
 
         create_subprocess_shell.return_value.wait = mocked_proc_wait
 
@@ -94,8 +91,7 @@ class RunScriptsTest(IsolatedAsyncioTestCase):
     async def test_run__must_run_scripts_as_root_user_when_user_id_is_not_defined_and_root_scripts_are_allowed(self, create_subprocess_shell: Mock, is_root_user: Mock):
         self.task.root_allowed = True
 
-        mocked_proc_wait = MagicMock(return_value=Future())
-        mocked_proc_wait.return_value.set_result(None)
+        mocked_proc_wait = AsyncMock(return_value=None)
 
         create_subprocess_shell.return_value.wait = mocked_proc_wait
 
@@ -113,8 +109,7 @@ class RunScriptsTest(IsolatedAsyncioTestCase):
     async def test_run__must_not_run_scripts_as_root_user_when_user_id_is_not_defined_and_root_scripts_are_forbidden(self, create_subprocess_shell: Mock, is_root_user: Mock):
         self.task.root_allowed = False
 
-        mocked_proc_wait = MagicMock(return_value=Future())
-        mocked_proc_wait.return_value.set_result(None)
+        mocked_proc_wait = AsyncMock(return_value=None)
 
         create_subprocess_shell.return_value.wait = mocked_proc_wait
 
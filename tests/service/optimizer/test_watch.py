@@ -9,13 +9,14 @@ from guapow.service.optimizer.profile import OptimizationProfile
 from guapow.service.optimizer.flow import OptimizationQueue
 from guapow.service.optimizer.task.model import OptimizedProcess, OptimizationContext
 from guapow.service.optimizer.watch import DeadProcessWatcher
+from tests import NULL_LOGGER
 
 
 class DeadProcessWatcherTest(IsolatedAsyncioTestCase):
 
     def setUp(self):
         self.context = OptimizationContext.empty()
-        self.context.logger = Mock()
+        self.context.logger = NULL_LOGGER
         self.context.queue = OptimizationQueue.empty()
 
     async def test_watch__must_set_processes_stopped_before_the_optimized_process_launch_that_should_be_relaunched(self):
@@ -44,6 +45,14 @@ class DeadProcessWatcherTest(IsolatedAsyncioTestCase):
         await watcher.watch(proc)
         self.assertEqual({}, watcher.get_to_relaunch_view())
 
+    def test_get_to_relaunch_view__must_return_a_copy(self):
+        watcher = DeadProcessWatcher(check_interval=1, restore_man=Mock(), context=self.context, to_relaunch={'a': '/a'})
+
+        view = watcher.get_to_relaunch_view()
+        view['b'] = '/b'
+
+        self.assertEqual({'a': '/a'}, watcher.get_to_relaunch_view())
+
     async def test_watch__must_update_a_cached_process_to_be_relaunched_command_when_it_does_not_start_with_a_forward_slash(self):
         watcher = DeadProcessWatcher(check_interval=1, restore_man=Mock(), context=self.context, to_relaunch={'a': 'a'})
 
@@ -1,5 +1,4 @@
 import re
-from asyncio import Future
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import patch, Mock, MagicMock, AsyncMock
 
@@ -239,8 +238,7 @@ class KWinCompositorTest(IsolatedAsyncioTestCase):
 
     async def test_is_enabled__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.is_enabled = MagicMock(return_value=Future())
-        inner_compositor.is_enabled.return_value.set_result(True)
+        inner_compositor.is_enabled = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -250,8 +248,7 @@ class KWinCompositorTest(IsolatedAsyncioTestCase):
 
     async def test_enable__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.enable = MagicMock(return_value=Future())
-        inner_compositor.enable.return_value.set_result(True)
+        inner_compositor.enable = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -261,8 +258,7 @@ class KWinCompositorTest(IsolatedAsyncioTestCase):
 
     async def test_disable__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.disable = MagicMock(return_value=Future())
-        inner_compositor.disable.return_value.set_result(True)
+        inner_compositor.disable = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -295,8 +291,7 @@ class Xfwm4CompositorTest(IsolatedAsyncioTestCase):
 
     async def test_is_enabled__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.is_enabled = MagicMock(return_value=Future())
-        inner_compositor.is_enabled.return_value.set_result(True)
+        inner_compositor.is_enabled = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -306,8 +301,7 @@ class Xfwm4CompositorTest(IsolatedAsyncioTestCase):
 
     async def test_enable__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.enable = MagicMock(return_value=Future())
-        inner_compositor.enable.return_value.set_result(True)
+        inner_compositor.enable = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -317,8 +311,7 @@ class Xfwm4CompositorTest(IsolatedAsyncioTestCase):
 
     async def test_disable__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.disable = MagicMock(return_value=Future())
-        inner_compositor.disable.return_value.set_result(True)
+        inner_compositor.disable = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -351,8 +344,7 @@ class MarcoCompositorTest(IsolatedAsyncioTestCase):
 
     async def test_is_enabled__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.is_enabled = MagicMock(return_value=Future())
-        inner_compositor.is_enabled.return_value.set_result(True)
+        inner_compositor.is_enabled = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -362,8 +354,7 @@ class MarcoCompositorTest(IsolatedAsyncioTestCase):
 
     async def test_enable__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.enable = MagicMock(return_value=Future())
-        inner_compositor.enable.return_value.set_result(True)
+        inner_compositor.enable = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -373,8 +364,7 @@ class MarcoCompositorTest(IsolatedAsyncioTestCase):
 
     async def test_disable__must_delegate_to_inner_compositor(self):
         inner_compositor = Mock()
-        inner_compositor.disable = MagicMock(return_value=Future())
-        inner_compositor.disable.return_value.set_result(True)
+        inner_compositor.disable = AsyncMock(return_value=True)
 
         self.compositor._compositor = inner_compositor
 
@@ -478,8 +468,7 @@ class PicomCompositorTest(IsolatedAsyncioTestCase):
         which.assert_called_once_with('picom')
 
     async def test_is_enabled__must_delegate_to_compositor_no_cli(self):
-        self.compositor_no_cli.is_enabled = MagicMock(return_value=Future())
-        self.compositor_no_cli.is_enabled.return_value.set_result(True)
+        self.compositor_no_cli.is_enabled = AsyncMock(return_value=True)
 
         user_env = {'abc': '123'}
 
@@ -487,8 +476,7 @@ class PicomCompositorTest(IsolatedAsyncioTestCase):
         self.compositor_no_cli.is_enabled.assert_called_once_with(123, user_env, self.context)
 
     async def test_enable__must_delegate_to_compositor_no_cli(self):
-        self.compositor_no_cli.enable = MagicMock(return_value=Future())
-        self.compositor_no_cli.enable.return_value.set_result(False)
+        self.compositor_no_cli.enable = AsyncMock(return_value=False)
 
         user_env = {'abc': '123'}
 
@@ -496,8 +484,7 @@ class PicomCompositorTest(IsolatedAsyncioTestCase):
         self.compositor_no_cli.enable.assert_called_once_with(123, user_env, self.context)
 
     async def test_disable__must_delegate_to_compositor_no_cli(self):
-        self.compositor_no_cli.disable = MagicMock(return_value=Future())
-        self.compositor_no_cli.disable.return_value.set_result(True)
+        self.compositor_no_cli.disable = AsyncMock(return_value=True)
 
         user_env = {'abc': '123'}
 
@@ -537,8 +524,7 @@ class CompizCompositorTest(IsolatedAsyncioTestCase):
         which.assert_called_once_with('compiz')
 
     async def test_is_enabled__must_delegate_to_compositor_no_cli(self):
-        self.compositor_no_cli.is_enabled = MagicMock(return_value=Future())
-        self.compositor_no_cli.is_enabled.return_value.set_result(True)
+        self.compositor_no_cli.is_enabled = AsyncMock(return_value=True)
 
         user_env = {'abc': '123'}
 
@@ -546,8 +532,7 @@ class CompizCompositorTest(IsolatedAsyncioTestCase):
         self.compositor_no_cli.is_enabled.assert_called_once_with(123, user_env, self.context)
 
     async def test_enable__must_delegate_to_compositor_no_cli(self):
-        self.compositor_no_cli.enable = MagicMock(return_value=Future())
-        self.compositor_no_cli.enable.return_value.set_result(False)
+        self.compositor_no_cli.enable = AsyncMock(return_value=False)
 
         user_env = {'abc': '123'}
 
@@ -555,8 +540,7 @@ class CompizCompositorTest(IsolatedAsyncioTestCase):
         self.compositor_no_cli.enable.assert_called_once_with(123, user_env, self.context)
 
     async def test_disable__must_delegate_to_compositor_no_cli(self):
-        self.compositor_no_cli.disable = MagicMock(return_value=Future())
-        self.compositor_no_cli.disable.return_value.set_result(True)
+        self.compositor_no_cli.disable = AsyncMock(return_value=True)
 
         user_env = {'abc': '123'}
         self.assertTrue(await self.compositor.disable(123, user_env, self.context))
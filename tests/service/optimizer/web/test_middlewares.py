@@ -1,4 +1,3 @@
-from asyncio import Future
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import MagicMock, Mock, AsyncMock, patch
 
@@ -15,8 +14,7 @@ class DecryptRequestTest(IsolatedAsyncioTestCase):
         request = MagicMock()
         request.app = web.Application()
 
-        handler = MagicMock(return_value=Future())
-        handler.return_value.set_result(web.Response(status=200))
+        handler = AsyncMock(return_value=web.Response(status=200))
 
         res = await decrypt_request(request, handler)
         self.assertIsInstance(res, web.Response)